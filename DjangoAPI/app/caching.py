@@ -0,0 +1,261 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+GENERATION_KEY = "ingest-generation"
+
+# Bodies smaller than this aren't worth a Content-Encoding
+MIN_COMPRESS_LENGTH = 200
+
+# How often a request waiting on another worker's render checks the cache
+RENDER_POLL_INTERVAL = 0.05
+
+_rendering = {}
+_rendering_lock = threading.Lock()
+
+
+def cache_is_shared():
+    """Whether other processes see this one's cache entries."""
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def check_cache_backend():
+    """Refuse a per-process cache behind several workers: each would keep
+    its own ingest generation, so an ingest through one worker (or
+    upload_to_django) would leave the others serving stale responses."""
+    if settings.WEB_CONCURRENCY > 1 and not cache_is_shared():
+        raise ImproperlyConfigured(
+            f"WEB_CONCURRENCY is {settings.WEB_CONCURRENCY} but the default cache "
+            f"({settings.CACHES['default']['BACKEND']}) is per process; set "
+            "CACHE_BACKEND to a shared one (file or Redis)"
+        )
+
+
+def ingest_generation():
+    """The current ingest generation, a nanosecond timestamp of the last ingest.
+
+    A timestamp rather than a counter needs no atomic incr() (the file
+    backend doesn't have one), and a cache that loses the key starts a new
+    generation instead of reusing an old one's entries.
+    """
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def bump_ingest_generation():
+    """Start a new generation; call after any write to the stat tables."""
+    generation = time.time_ns()
+    cache.set(GENERATION_KEY, generation, timeout=None)
+    return generation
+
+
+def request_digest(request, generation):
+    """Hash of what a read response depends on: the ingest generation, the
+    path, the query string (in any order) and the negotiated media type."""
+    query = sorted(request.GET.lists())
+    return hashlib.sha1(
+        f"{generation}|{request.path}?{query}|{request.accepted_media_type}".encode()
+    ).hexdigest()
+
+
+def response_cache_key(request, generation=None):
+    if generation is None:
+        generation = ingest_generation()
+    return f"response:{generation}:{request_digest(request, generation)}"
+
+
+def compressed_encodings(content):
+    """The encodings of `content` worth storing, best first."""
+    if len(content) < MIN_COMPRESS_LENGTH:
+        return {}
+    encodings = {}
+    if brotli is not None:
+        encodings["br"] = brotli.compress(content)
+    encodings["gzip"] = compress_string(content)
+    return {
+        coding: body for coding, body in encodings.items() if len(body) < len(content)
+    }
+
+
+def accepted_encodings(request):
+    """Content codings the client accepts (q > 0), from Accept-Encoding."""
+    accepted = set()
+    for item in request.headers.get("Accept-Encoding", "").split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def single_flight(key, compute, timeout):
+    """cache.get(key), calling compute() for a miss at most once at a time.
+
+    Concurrent callers in this process wait on an Event for the first one;
+    other processes see its `lock:` key (taken with the atomic cache.add)
+    and poll the cache until the value shows up. That only works through a
+    cache the processes share (file or Redis, which check_cache_backend
+    requires behind several workers); with a per-process cache each process
+    renders once on its own. compute() returns the
+    value to cache, or None for a result that shouldn't be shared, in which
+    case each waiter computes its own. Nobody waits longer than
+    RESPONSE_RENDER_TIMEOUT, so a crashed renderer only costs that delay.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    with _rendering_lock:
+        done = _rendering.get(key)
+        leader = done is None
+        if leader:
+            done = _rendering[key] = threading.Event()
+
+    if not leader:
+        done.wait(settings.RESPONSE_RENDER_TIMEOUT)
+        value = cache.get(key)
+        return value if value is not None else compute()
+
+    try:
+        return _compute_locked(key, compute, timeout)
+    finally:
+        with _rendering_lock:
+            del _rendering[key]
+        done.set()
+
+
+def _compute_locked(key, compute, timeout):
+    lock_key = f"lock:{key}"
+    locked = cache.add(lock_key, True, timeout=settings.RESPONSE_RENDER_TIMEOUT)
+    deadline = time.monotonic() + settings.RESPONSE_RENDER_TIMEOUT
+    while not locked and time.monotonic() < deadline:
+        time.sleep(RENDER_POLL_INTERVAL)
+        value = cache.get(key)
+        if value is not None:
+            return value
+        locked = cache.add(lock_key, True, timeout=settings.RESPONSE_RENDER_TIMEOUT)
+
+    try:
+        value = compute()
+        if value is not None:
+            cache.set(key, value, timeout=timeout)
+        return value
+    finally:
+        if locked:
+            cache.delete(lock_key)
+
+
+class ConditionalGetMixin:
+    """ETags for read endpoints, derived from the ingest generation.
+
+    A matching If-None-Match is answered with a 304 before the queryset is
+    built. Responses carry Cache-Control: no-cache so browsers revalidate
+    (cheaply) instead of guessing a freshness lifetime.
+
+    There's no Last-Modified: an ingest bumps the generation many times a
+    second, so a one-second HTTP date can't tell a body fetched mid-ingest
+    from the final one, and If-Modified-Since would 304 a stale body.
+    """
+
+    def conditional_etag(self, request):
+        return f'"{request_digest(request, ingest_generation())}"'
+
+    def conditional(self, handler, request, *args, **kwargs):
+        etag = self.conditional_etag(request)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            if response.has_header("Content-Encoding"):
+                # the compressed bytes aren't the identity ones (as GZipMiddleware)
+                etag = f"W/{etag}"
+            response["ETag"] = etag
+            patch_cache_control(response, no_cache=True)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
+
+
+class IngestCachedMixin:
+    """Caches rendered JSON list() responses for the current ingest generation.
+
+    Entries are keyed on the generation, so the create views bumping it is
+    all the invalidation there is; old generations simply age out. Identical
+    requests arriving during a miss (everyone refreshing after a game) share
+    one render through single_flight().
+
+    The brotli (when installed) and gzip encodings are compressed once and
+    stored with the entry; each request gets the best one its
+    Accept-Encoding allows.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format != "json":
+            return super().list(request, *args, **kwargs)
+
+        rendered = []
+
+        def render():
+            response = self.render_list(request, *args, **kwargs)
+            rendered.append(response)
+            if response.status_code == 200:
+                return (
+                    response.content,
+                    response["Content-Type"],
+                    compressed_encodings(response.content),
+                )
+            return None
+
+        cached = single_flight(
+            response_cache_key(request), render, settings.RESPONSE_CACHE_TIMEOUT
+        )
+        if cached is None:
+            return rendered[0]
+
+        content, content_type, encodings = cached
+        accepted = accepted_encodings(request)
+        coding = next((coding for coding in encodings if coding in accepted), None)
+        response = HttpResponse(
+            encodings[coding] if coding else content, content_type=content_type
+        )
+        if coding:
+            response["Content-Encoding"] = coding
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
+
+    def render_list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.accepted_renderer = request.accepted_renderer
+        response.accepted_media_type = request.accepted_media_type
+        response.renderer_context = self.get_renderer_context()
+        return response.render()
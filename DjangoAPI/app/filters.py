@@ -0,0 +1,112 @@
+from django.db import models
+from django_filters import rest_framework as filters
+from rest_framework.filters import OrderingFilter
+
+from .models import (
+    BatterStat,
+    BattingSituational,
+    FieldingStat,
+    GameInfo,
+    PitcherStat,
+    PlayerSeasonBatting,
+    PlayerSeasonPitching,
+    SituationalSplit,
+)
+
+
+class NullsLastOrderingFilter(OrderingFilter):
+    # rate stats are NULL for players without a denominator (no AB, no
+    # outs); keep them at the bottom in both directions, the way the
+    # frontend sorts them
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+
+        if ordering:
+            return queryset.order_by(*[
+                models.F(field[1:]).desc(nulls_last=True)
+                if field.startswith("-")
+                else models.F(field).asc(nulls_last=True)
+                for field in ordering
+            ])
+
+        return queryset
+
+
+class TeamBattingStatsFilter(filters.FilterSet):
+    avg__gte = filters.NumberFilter(field_name="avg", lookup_expr="gte")
+    avg__lte = filters.NumberFilter(field_name="avg", lookup_expr="lte")
+    obp__gte = filters.NumberFilter(field_name="obp", lookup_expr="gte")
+    obp__lte = filters.NumberFilter(field_name="obp", lookup_expr="lte")
+    slg__gte = filters.NumberFilter(field_name="slg", lookup_expr="gte")
+    slg__lte = filters.NumberFilter(field_name="slg", lookup_expr="lte")
+    ops__gte = filters.NumberFilter(field_name="ops", lookup_expr="gte")
+    ops__lte = filters.NumberFilter(field_name="ops", lookup_expr="lte")
+    total_pa__gte = filters.NumberFilter(field_name="total_pa", lookup_expr="gte")
+
+    class Meta:
+        model = PlayerSeasonBatting
+        fields = "__all__"
+
+
+class TeamPitchingStatsFilter(filters.FilterSet):
+    total_era__gte = filters.NumberFilter(field_name="total_era", lookup_expr="gte")
+    total_era__lte = filters.NumberFilter(field_name="total_era", lookup_expr="lte")
+    total_whip__gte = filters.NumberFilter(field_name="total_whip", lookup_expr="gte")
+    total_whip__lte = filters.NumberFilter(field_name="total_whip", lookup_expr="lte")
+    total_outs__gte = filters.NumberFilter(field_name="total_outs", lookup_expr="gte")
+
+    class Meta:
+        model = PlayerSeasonPitching
+        fields = "__all__"
+
+
+class GameDateFilter(filters.FilterSet):
+    # date ranges on the game's indexed game_date, for rows linked to a game
+    game_date__gte = filters.DateFilter(field_name="game_id__game_date", lookup_expr="gte")
+    game_date__lte = filters.DateFilter(field_name="game_id__game_date", lookup_expr="lte")
+
+
+class BatterStatFilter(GameDateFilter):
+    class Meta:
+        model = BatterStat
+        fields = "__all__"
+
+
+class BatterSituationalFilter(GameDateFilter):
+    class Meta:
+        model = BattingSituational
+        fields = ["game_id", "player_id"]
+
+
+class PitcherStatFilter(GameDateFilter):
+    class Meta:
+        model = PitcherStat
+        fields = "__all__"
+
+
+class FieldingStatFilter(GameDateFilter):
+    class Meta:
+        model = FieldingStat
+        fields = "__all__"
+
+
+class GameInfoFilter(filters.FilterSet):
+    game_date__gte = filters.DateFilter(field_name="game_date", lookup_expr="gte")
+    game_date__lte = filters.DateFilter(field_name="game_date", lookup_expr="lte")
+
+    class Meta:
+        model = GameInfo
+        fields = "__all__"
+
+
+class SituationalSplitFilter(GameDateFilter):
+    # a plain number rather than a model choice, which would look the
+    # player up first
+    player_id = filters.NumberFilter()
+    start = filters.DateFilter(field_name="game_id__game_date", lookup_expr="gte")
+    end = filters.DateFilter(field_name="game_id__game_date", lookup_expr="lte")
+    season = filters.NumberFilter(field_name="game_id__game_date", lookup_expr="year")
+
+    class Meta:
+        model = SituationalSplit
+        fields = ["player_id", "game_id", "situation"]
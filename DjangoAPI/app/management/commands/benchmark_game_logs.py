@@ -0,0 +1,65 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.test import APIRequestFactory
+
+from app.views import BatterStatViewSet, FieldingStatViewSet, PitcherStatViewSet
+
+
+ENDPOINTS = {
+    "batter_stats": BatterStatViewSet,
+    "pitcher_stats": PitcherStatViewSet,
+    "fielding_stats": FieldingStatViewSet,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the game-log list endpoints through the .values() fast path "
+        "and through the ModelSerializer, and checks both render the same bytes. "
+        "Also reports the payload with the game fields sideloaded."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--page-size", type=int, default=None,
+            help="request one page of this size instead of the whole log",
+        )
+
+    def handle(self, *args, **options):
+        factory = APIRequestFactory()
+        query = {"page_size": options["page_size"]} if options["page_size"] else {}
+
+        for name, viewset in ENDPOINTS.items():
+            timings = {}
+            content = {}
+            for fast in (False, True):
+                # render_list is list() without the response cache, which
+                # would otherwise serve every repeat (and the other path)
+                view = viewset.as_view({"get": "render_list"}, fast_list=fast)
+                start = time.perf_counter()
+                for _ in range(options["repeat"]):
+                    response = view(factory.get(f"/api/{name}/", query))
+                timings[fast] = (time.perf_counter() - start) / options["repeat"]
+                content[fast] = response.content
+
+            data = response.data
+            rows = len(data["results"] if isinstance(data, dict) else data)
+            self.stdout.write(
+                f"{name}: {rows} rows | serializer {timings[False] * 1000:.1f} ms "
+                f"({rows / timings[False]:.0f} rows/s) | fast {timings[True] * 1000:.1f} ms "
+                f"({rows / timings[True]:.0f} rows/s) | {timings[False] / timings[True]:.1f}x"
+            )
+            if content[False] != content[True]:
+                self.stderr.write(self.style.ERROR(f"{name}: responses differ"))
+
+            view = viewset.as_view({"get": "render_list"})
+            start = time.perf_counter()
+            for _ in range(options["repeat"]):
+                response = view(factory.get(f"/api/{name}/", {**query, "sideload": "games"}))
+            sideloaded = (time.perf_counter() - start) / options["repeat"]
+            self.stdout.write(
+                f"{name}: {len(content[True]) / 1024:.0f} KiB | sideload=games "
+                f"{len(response.content) / 1024:.0f} KiB in {sideloaded * 1000:.1f} ms"
+            )
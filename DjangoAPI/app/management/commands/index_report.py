@@ -0,0 +1,163 @@
+import re
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from app.management.commands.rebuild_stats import SEASON_TOTALS
+from app.models import BatterStat, BattingSituational, FieldingStat, GameInfo, PitcherStat
+from app.warming import PLAYER_PATHS, TEAM_PATHS, active_player_ids, client_host
+
+
+# the per-player and per-game reads the frontend makes, besides the
+# warmed ones
+EXTRA_PLAYER_PATHS = [
+    "stats_as_of/?player_id={player}&date={date}",
+]
+GAME_PATHS = [
+    "batter_stats/?game_id={game}",
+    "pitcher_stats/?game_id={game}",
+    "fielding_stats/?game_id={game}",
+    "batter_situational_stats/?game_id={game}",
+]
+# the paginated listings; each is reported for its first page and the
+# page after it, which reads through the cursor
+LISTING_PATHS = [
+    "batter_stats/",
+    "pitcher_stats/",
+    "fielding_stats/",
+    "batter_situational_stats/",
+    "game_info/",
+]
+# the raw per-game tables, which no endpoint should read end to end
+STAT_TABLES = {
+    model._meta.db_table for model in (BatterStat, PitcherStat, FieldingStat, BattingSituational)
+}
+# every table an endpoint reads stats from; a path that queries none of
+# them (an error, a cached response) checked nothing
+DATA_TABLES = STAT_TABLES | {
+    model._meta.db_table for model in (GameInfo, *SEASON_TOTALS)
+}
+
+# SQLite's EXPLAIN QUERY PLAN and Postgres' EXPLAIN
+INDEX = re.compile(
+    r"USING (?:COVERING |INTEGER PRIMARY KEY)?INDEX (\w+)|Index (?:Only )?Scan using (\w+)"
+    r"|Bitmap Index Scan on (\w+)"
+)
+# not SQLite's "SCAN t USING INDEX i", a scan in index order that stops at
+# the LIMIT, counted as a use of i above
+SCAN = re.compile(r"\bSCAN (\w+)\b(?! USING (?:COVERING )?INDEX)|Seq Scan on (\w+)")
+
+
+def explain(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}")
+        return [str(row[-1]) for row in cursor.fetchall()]
+
+
+def plan_usage(lines):
+    """Indexes the plan uses and tables it reads in full."""
+    indexes, scans = set(), set()
+    for line in lines:
+        for match in INDEX.finditer(line):
+            indexes.add(next(name for name in match.groups() if name))
+        for match in SCAN.finditer(line):
+            table = next(name for name in match.groups() if name)
+            # not SQLite's subquery scans ("SCAN 2") or "SCAN CONSTANT ROW"
+            if table.islower():
+                scans.add(table)
+    return indexes, scans
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders each endpoint the frontend reads for one active player and "
+        "game, plus the first two pages of each unfiltered listing, EXPLAINs "
+        "every query it runs, and reports the indexes used "
+        "and the tables read in full. Small tables may be scanned whatever "
+        "their indexes; run it against production-sized data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--player", type=int, help="player_id to report on")
+        parser.add_argument(
+            "--strict",
+            action="store_true",
+            help="exit non-zero if an endpoint reads a raw stat table in full",
+        )
+
+    def paths(self, player):
+        game = GameInfo.objects.filter(batterstat__player_id=player).order_by("-game_date").first()
+        if game is None:
+            game = GameInfo.objects.order_by("-game_date").first()
+        values = {"player": player, "game": game.pk, "date": game.game_date}
+        return TEAM_PATHS + LISTING_PATHS + [
+            path.replace("{}", "{player}").format(**values)
+            for path in PLAYER_PATHS + EXTRA_PLAYER_PATHS + GAME_PATHS
+        ]
+
+    # an empty cache of this process's own, so every response is rendered
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "index-report",
+            }
+        }
+    )
+    def handle(self, *args, **options):
+        player = options["player"] or next(iter(active_player_ids()), None)
+        if player is None:
+            raise CommandError("No stat lines to report on")
+
+        # local-memory caches with one LOCATION share their entries
+        cache.clear()
+        client = Client(HTTP_HOST=client_host())
+        paths = self.paths(player)
+        full_reads = []
+        unchecked = []
+        for path in paths:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(f"/api/{path}", HTTP_ACCEPT="application/json")
+            if path in LISTING_PATHS and response.status_code == 200:
+                next_page = response.json().get("next")
+                if next_page:
+                    # reported in its turn, after the other paths
+                    paths.append(next_page.partition("/api/")[2])
+            indexes, scans = set(), set()
+            for query in queries.captured_queries:
+                used, scanned = plan_usage(explain(query["sql"]))
+                indexes |= used
+                scans |= scanned
+            stat_scans = sorted(scans & STAT_TABLES)
+            if stat_scans:
+                full_reads.append((path, stat_scans))
+            read_data = any(
+                f'"{table}"' in query["sql"]
+                for query in queries.captured_queries
+                for table in DATA_TABLES
+            )
+            if response.status_code != 200 or not read_data:
+                unchecked.append(path)
+
+            self.stdout.write(f"{path} (HTTP {response.status_code}, {len(queries)} queries)")
+            self.stdout.write(f"  indexes: {', '.join(sorted(indexes)) or '-'}")
+            if scans:
+                line = f"  full reads: {', '.join(sorted(scans))}"
+                self.stdout.write(self.style.WARNING(line) if stat_scans else line)
+            if path in unchecked:
+                self.stdout.write(self.style.WARNING("  not checked: no stat query answered"))
+
+        failed = {path for path, _ in full_reads} | set(unchecked)
+        self.stdout.write(
+            f"{len(paths) - len(failed)}/{len(paths)} endpoints read the stat "
+            "tables through indexes only"
+        )
+        if failed and options["strict"]:
+            raise CommandError(
+                f"{len(full_reads)} endpoints read a stat table in full, "
+                f"{len(unchecked)} answered without reading one: "
+                + ", ".join(path for path in paths if path in failed)
+            )
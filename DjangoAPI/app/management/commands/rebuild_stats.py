@@ -0,0 +1,222 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, models, transaction
+
+from app.caching import bump_ingest_generation
+from app.models import (
+    GameInfo,
+    PlayerGameBatting,
+    PlayerGameFielding,
+    PlayerGamePitching,
+    PlayerSeasonBatting,
+    PlayerSeasonFielding,
+    PlayerSeasonPitching,
+    SituationalSplit,
+    season_of,
+)
+
+
+SEASON_TOTALS = (
+    PlayerSeasonBatting,
+    PlayerSeasonPitching,
+    PlayerSeasonFielding,
+    PlayerGameBatting,
+    PlayerGamePitching,
+    PlayerGameFielding,
+    SituationalSplit,
+)
+
+
+def in_season(season):
+    """Rows whose game is in `season`; season None is rows without a game."""
+    if season is None:
+        return models.Q(game_id__isnull=True)
+    return models.Q(game_id__game_date__year=season)
+
+
+def stored_rows(model, season):
+    if any(field.name == "season" for field in model._meta.get_fields()):
+        return model.objects.filter(season=season)
+    return model.objects.filter(in_season(season))
+
+
+def diff(model, season, players=None):
+    """Stored rows of one season that differ from the raw rows' sums, and
+    the freshly summed rows that replace them."""
+    source = model.source.objects.filter(in_season(season))
+    stored = stored_rows(model, season)
+    if players:
+        source = source.filter(player_id__in=players)
+        stored = stored.filter(player_id__in=players)
+
+    expected = {row.key_tuple(): row for row in model.from_source(source)}
+    current = {row.key_tuple(): (row.pk, row.totals()) for row in stored}
+    stale = [
+        pk
+        for key, (pk, totals) in current.items()
+        if key not in expected or expected[key].totals() != totals
+    ]
+    fresh = [
+        row
+        for key, row in expected.items()
+        if key not in current or current[key][1] != row.totals()
+    ]
+    return stale, fresh, len(expected)
+
+
+def diff_task(label, season, players):
+    # runs in a worker process
+    return label, season, *diff(apps.get_model(label), season, players)
+
+
+def lock_tables(tables):
+    """Hold off ingest until the current transaction ends.
+
+    SHARE ROW EXCLUSIVE waits for the writes in flight and blocks new ones
+    (and another rebuild) while leaving the tables readable. Postgres only:
+    SQLite has one writer at a time, and a write committed after this
+    transaction's first read makes its own write fail instead of being
+    overwritten.
+    """
+    if connection.vendor != "postgresql":
+        return
+    names = ", ".join(connection.ops.quote_name(model._meta.db_table) for model in tables)
+    with connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {names} IN SHARE ROW EXCLUSIVE MODE")
+
+
+def collect(results):
+    """{label: (stale pks, fresh rows, [row count])} over every season."""
+    changes = {}
+    for label, season, stale, fresh, count in results:
+        model_stale, model_fresh, model_count = changes.setdefault(label, ([], [], [0]))
+        model_stale.extend(stale)
+        model_fresh.extend(fresh)
+        model_count[0] += count
+    return changes
+
+
+def init_worker():
+    # a no-op under fork; spawned workers have to load the app registry
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the PlayerSeason* totals, PlayerGame* snapshots and "
+        "SituationalSplit rows from the raw stat rows, one season per task "
+        "across a process pool, and swaps the rows that differ in a single "
+        "transaction. Ingest is held off during the swap and the differing "
+        "seasons are diffed again inside it, so a game ingested while the "
+        "pool ran isn't overwritten. With --verify only reports them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="report totals that don't match the raw rows and exit non-zero",
+        )
+        parser.add_argument(
+            "--season",
+            type=int,
+            action="append",
+            dest="seasons",
+            help="only this season (repeatable)",
+        )
+        parser.add_argument(
+            "--player",
+            type=int,
+            action="append",
+            dest="players",
+            help="only this player_id (repeatable)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="processes to diff seasons in; 1 diffs in this process",
+        )
+
+    def seasons(self):
+        seasons = {season_of(game) for game in GameInfo.objects.only("game_date")}
+        for model in SEASON_TOTALS:
+            if any(field.name == "season" for field in model._meta.get_fields()):
+                seasons.update(model.objects.values_list("season", flat=True).distinct())
+        return [None, *sorted(seasons)]
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        seasons = options["seasons"] or self.seasons()
+        tasks = [
+            (model._meta.label, season, options["players"])
+            for model in SEASON_TOTALS
+            for season in seasons
+        ]
+
+        workers = min(options["workers"], len(tasks))
+        if workers <= 1:
+            results = [diff_task(*task) for task in tasks]
+        else:
+            # workers open their own connections; forked children must not
+            # share this process's
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+                results = list(pool.map(diff_task, *zip(*tasks)))
+
+        changes = collect(results)
+        mismatched = 0
+        for label, (stale, fresh, (count,)) in changes.items():
+            name = label.split(".")[-1]
+            differing = max(len(stale), len(fresh))
+            if not differing:
+                self.stdout.write(f"{name}: {count} rows match")
+                continue
+            mismatched += differing
+            for row in fresh[:20]:
+                self.stderr.write(f"{name}: {row.key_tuple()} differs")
+            if len(stale) > len(fresh):
+                self.stderr.write(f"{name}: {len(stale) - len(fresh)} stored rows have no raw rows")
+
+        if mismatched and options["verify"]:
+            raise CommandError(f"{mismatched} season totals don't match the raw rows")
+
+        if mismatched:
+            # every table's corrections land together, or none do
+            with transaction.atomic():
+                # in one order, so two rebuilds queue instead of deadlocking
+                lock_tables(
+                    dict.fromkeys(
+                        (GameInfo, *(model.source for model in SEASON_TOTALS), *SEASON_TOTALS)
+                    )
+                )
+                # the pool's diffs may predate an ingest that finished
+                # before the lock; redo the differing ones under it
+                changes = collect(
+                    diff_task(label, season, options["players"]) if stale or fresh
+                    else (label, season, stale, fresh, count)
+                    for label, season, stale, fresh, count in results
+                )
+                for label, (stale, fresh, _) in changes.items():
+                    model = apps.get_model(label)
+                    # chunked to stay under the database's parameter limit
+                    for start in range(0, len(stale), 1000):
+                        model.objects.filter(pk__in=stale[start:start + 1000]).delete()
+                    model.objects.bulk_create(fresh, batch_size=1000)
+            for label, (stale, fresh, (count,)) in changes.items():
+                if stale or fresh:
+                    self.stdout.write(
+                        f"{label.split('.')[-1]}: replaced {len(stale)} of {count} rows "
+                        f"with {len(fresh)}"
+                    )
+            bump_ingest_generation()
+
+        self.stdout.write(
+            f"Checked {len(tasks)} table-seasons in {time.perf_counter() - started:.2f}s "
+            f"with {workers} workers"
+        )
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.warming import http_fetcher, warm, warm_paths
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-renders the team aggregate endpoints and every active player's "
+        "game-log endpoints into the response cache by requesting them from "
+        "the running server."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=4, help="requests in flight at once"
+        )
+        parser.add_argument(
+            "--base-url",
+            default="http://127.0.0.1:8000/api/",
+            help="the API root of the server whose cache to warm",
+        )
+
+    def handle(self, *args, **options):
+        results, elapsed = warm(
+            warm_paths(), http_fetcher(options["base_url"]), workers=options["workers"]
+        )
+
+        failed = [(path, status) for path, status, _ in results if status != 200]
+        for path, status in failed:
+            reason = f"HTTP {status}" if isinstance(status, int) else status
+            self.stderr.write(self.style.WARNING(f"{path}: {reason}"))
+        if results and len(failed) == len(results):
+            raise CommandError(
+                f"No endpoint warmed; is the server running at {options['base_url']} "
+                "and is its host in ALLOWED_HOSTS?"
+            )
+        if results:
+            slowest = max(results, key=lambda result: result[2])
+            self.stdout.write(
+                f"Warmed {len(results) - len(failed)}/{len(results)} endpoints in "
+                f"{elapsed:.2f}s with {options['workers']} workers "
+                f"(slowest: {slowest[0]} {slowest[2]:.2f}s)"
+            )
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from django.db import migrations
+
+# the scraper has always sent "YYYY-MM-DD"; the box score's own format is
+# accepted as well so a hand-entered game doesn't stop the conversion
+FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y")
+
+
+def parse(value):
+    for format in FORMATS:
+        try:
+            return datetime.strptime(value.strip(), format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def normalize_game_dates(apps, schema_editor):
+    GameInfo = apps.get_model("app", "GameInfo")
+    games = []
+    for game in GameInfo.objects.only("game_date").iterator():
+        date = parse(game.game_date)
+        if date is None:
+            raise ValueError(
+                f"GameInfo {game.pk} has game_date {game.game_date!r}, which isn't a date"
+            )
+        if game.game_date != date.isoformat():
+            game.game_date = date.isoformat()
+            games.append(game)
+    GameInfo.objects.bulk_update(games, ["game_date"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    # ahead of the season/snapshot backfills (0033-0044), which read the
+    # year off game_date as "YYYY-..." and copy it into DateFields
+    dependencies = [
+        ('app', '0032_remove_gameinfo_selected_team_id_and_more'),
+    ]
+
+    operations = [
+        # kept apart from the type change (0046) so each runs in its own
+        # transaction
+        migrations.RunPython(normalize_game_dates, migrations.RunPython.noop),
+    ]
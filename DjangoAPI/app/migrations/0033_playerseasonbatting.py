@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-18 08:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0032_normalize_game_dates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerSeasonBatting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.IntegerField()),
+                ('games', models.IntegerField(default=0)),
+                ('ab', models.IntegerField(default=0)),
+                ('runs', models.IntegerField(default=0)),
+                ('hits', models.IntegerField(default=0)),
+                ('rbi', models.IntegerField(default=0)),
+                ('bb', models.IntegerField(default=0)),
+                ('so', models.IntegerField(default=0)),
+                ('hbp', models.IntegerField(default=0)),
+                ('ibb', models.IntegerField(default=0)),
+                ('sb', models.IntegerField(default=0)),
+                ('cs', models.IntegerField(default=0)),
+                ('dp', models.IntegerField(default=0)),
+                ('double', models.IntegerField(default=0)),
+                ('triple', models.IntegerField(default=0)),
+                ('hr', models.IntegerField(default=0)),
+                ('sf', models.IntegerField(default=0)),
+                ('sh', models.IntegerField(default=0)),
+                ('picked_off', models.IntegerField(default=0)),
+                ('player_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.playerinfo')),
+                ('team', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='app.schoolinfo')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('season', 'team', 'player_id'), name='unique_player_season_batting')],
+            },
+        ),
+    ]
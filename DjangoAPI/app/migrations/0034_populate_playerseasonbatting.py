@@ -0,0 +1,51 @@
+from django.db import migrations, models
+from django.db.models.functions import Cast, Substr
+
+TOTALS = (
+    "ab", "runs", "hits", "rbi", "bb", "so", "hbp", "ibb", "sb", "cs", "dp",
+    "double", "triple", "hr", "sf", "sh", "picked_off",
+)
+
+
+def populate(apps, schema_editor):
+    BatterStat = apps.get_model("app", "BatterStat")
+    PlayerSeasonBatting = apps.get_model("app", "PlayerSeasonBatting")
+
+    rows = (
+        BatterStat.objects.filter(player_id__isnull=False, game_id__isnull=False)
+        .annotate(
+            # game_date is "YYYY-MM-DD"
+            season=Cast(Substr("game_id__game_date", 1, 4), models.IntegerField())
+        )
+        .values("player_id", "season", "game_id__selected_team")
+        .annotate(
+            games=models.Count("id"),
+            **{f"total_{field}": models.Sum(field) for field in TOTALS},
+        )
+        .order_by()
+    )
+    PlayerSeasonBatting.objects.bulk_create(
+        PlayerSeasonBatting(
+            player_id_id=row["player_id"],
+            season=row["season"],
+            team_id=row["game_id__selected_team"],
+            games=row["games"],
+            **{field: row[f"total_{field}"] for field in TOTALS},
+        )
+        for row in rows
+    )
+
+
+def clear(apps, schema_editor):
+    apps.get_model("app", "PlayerSeasonBatting").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0033_playerseasonbatting"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, clear),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0034_populate_playerseasonbatting'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerSeasonPitching',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.IntegerField()),
+                ('games', models.IntegerField(default=0)),
+                ('starter', models.IntegerField(default=0)),
+                ('outs', models.IntegerField(default=0)),
+                ('h', models.IntegerField(default=0)),
+                ('r', models.IntegerField(default=0)),
+                ('er', models.IntegerField(default=0)),
+                ('bb', models.IntegerField(default=0)),
+                ('so', models.IntegerField(default=0)),
+                ('bf', models.IntegerField(default=0)),
+                ('doubles_allowed', models.IntegerField(default=0)),
+                ('triples_allowed', models.IntegerField(default=0)),
+                ('hr_allowed', models.IntegerField(default=0)),
+                ('wp', models.IntegerField(default=0)),
+                ('hb', models.IntegerField(default=0)),
+                ('ibb', models.IntegerField(default=0)),
+                ('balk', models.IntegerField(default=0)),
+                ('ir', models.IntegerField(default=0)),
+                ('irs', models.IntegerField(default=0)),
+                ('sh_allowed', models.IntegerField(default=0)),
+                ('sf_allowed', models.IntegerField(default=0)),
+                ('kl', models.IntegerField(default=0)),
+                ('pickoffs', models.IntegerField(default=0)),
+                ('win', models.IntegerField(default=0)),
+                ('loss', models.IntegerField(default=0)),
+                ('sv', models.IntegerField(default=0)),
+                ('player_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.playerinfo')),
+                ('team', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='app.schoolinfo')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('season', 'team', 'player_id'), name='unique_player_season_pitching')],
+            },
+        ),
+    ]
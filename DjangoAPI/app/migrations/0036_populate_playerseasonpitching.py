@@ -0,0 +1,52 @@
+from django.db import migrations, models
+from django.db.models.functions import Cast, Substr
+
+TOTALS = (
+    "starter", "outs", "h", "r", "er", "bb", "so", "bf", "doubles_allowed",
+    "triples_allowed", "hr_allowed", "wp", "hb", "ibb", "balk", "ir", "irs",
+    "sh_allowed", "sf_allowed", "kl", "pickoffs", "win", "loss", "sv",
+)
+
+
+def populate(apps, schema_editor):
+    PitcherStat = apps.get_model("app", "PitcherStat")
+    PlayerSeasonPitching = apps.get_model("app", "PlayerSeasonPitching")
+
+    rows = (
+        PitcherStat.objects.filter(player_id__isnull=False, game_id__isnull=False)
+        .annotate(
+            # game_date is "YYYY-MM-DD"
+            season=Cast(Substr("game_id__game_date", 1, 4), models.IntegerField())
+        )
+        .values("player_id", "season", "game_id__selected_team")
+        .annotate(
+            games=models.Count("id"),
+            **{f"total_{field}": models.Sum(field) for field in TOTALS},
+        )
+        .order_by()
+    )
+    PlayerSeasonPitching.objects.bulk_create(
+        PlayerSeasonPitching(
+            player_id_id=row["player_id"],
+            season=row["season"],
+            team_id=row["game_id__selected_team"],
+            games=row["games"],
+            **{field: row[f"total_{field}"] for field in TOTALS},
+        )
+        for row in rows
+    )
+
+
+def clear(apps, schema_editor):
+    apps.get_model("app", "PlayerSeasonPitching").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0035_playerseasonpitching"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, clear),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0036_populate_playerseasonpitching'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerSeasonFielding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.IntegerField()),
+                ('games', models.IntegerField(default=0)),
+                ('player_position', models.CharField(max_length=7)),
+                ('po', models.IntegerField(default=0)),
+                ('a', models.IntegerField(default=0)),
+                ('e', models.IntegerField(default=0)),
+                ('catchers_interference', models.IntegerField(default=0)),
+                ('pb', models.IntegerField(default=0)),
+                ('sba', models.IntegerField(default=0)),
+                ('cs', models.IntegerField(default=0)),
+                ('dp', models.IntegerField(default=0)),
+                ('tp', models.IntegerField(default=0)),
+                ('player_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.playerinfo')),
+                ('team', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='app.schoolinfo')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('season', 'team', 'player_id', 'player_position'), name='unique_player_season_fielding')],
+            },
+        ),
+    ]
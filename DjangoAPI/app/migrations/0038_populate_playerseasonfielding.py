@@ -0,0 +1,51 @@
+from django.db import migrations, models
+from django.db.models.functions import Cast, Substr
+
+TOTALS = (
+    "po", "a", "e", "catchers_interference", "pb", "sba", "cs", "dp", "tp",
+)
+
+
+def populate(apps, schema_editor):
+    FieldingStat = apps.get_model("app", "FieldingStat")
+    PlayerSeasonFielding = apps.get_model("app", "PlayerSeasonFielding")
+
+    rows = (
+        FieldingStat.objects.filter(player_id__isnull=False, game_id__isnull=False)
+        .annotate(
+            # game_date is "YYYY-MM-DD"
+            season=Cast(Substr("game_id__game_date", 1, 4), models.IntegerField())
+        )
+        .values("player_id", "season", "game_id__selected_team", "player_position")
+        .annotate(
+            games=models.Count("id"),
+            **{f"total_{field}": models.Sum(field) for field in TOTALS},
+        )
+        .order_by()
+    )
+    PlayerSeasonFielding.objects.bulk_create(
+        PlayerSeasonFielding(
+            player_id_id=row["player_id"],
+            season=row["season"],
+            team_id=row["game_id__selected_team"],
+            player_position=row["player_position"],
+            games=row["games"],
+            **{field: row[f"total_{field}"] for field in TOTALS},
+        )
+        for row in rows
+    )
+
+
+def clear(apps, schema_editor):
+    apps.get_model("app", "PlayerSeasonFielding").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0037_playerseasonfielding"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, clear),
+    ]
@@ -0,0 +1,112 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0038_populate_playerseasonfielding'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerGameBatting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.IntegerField()),
+                ('game_date', models.DateField()),
+                ('games', models.IntegerField(default=0)),
+                ('ab', models.IntegerField(default=0)),
+                ('runs', models.IntegerField(default=0)),
+                ('hits', models.IntegerField(default=0)),
+                ('rbi', models.IntegerField(default=0)),
+                ('bb', models.IntegerField(default=0)),
+                ('so', models.IntegerField(default=0)),
+                ('hbp', models.IntegerField(default=0)),
+                ('ibb', models.IntegerField(default=0)),
+                ('sb', models.IntegerField(default=0)),
+                ('cs', models.IntegerField(default=0)),
+                ('dp', models.IntegerField(default=0)),
+                ('double', models.IntegerField(default=0)),
+                ('triple', models.IntegerField(default=0)),
+                ('hr', models.IntegerField(default=0)),
+                ('sf', models.IntegerField(default=0)),
+                ('sh', models.IntegerField(default=0)),
+                ('picked_off', models.IntegerField(default=0)),
+                ('game_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.gameinfo')),
+                ('player_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.playerinfo')),
+            ],
+            options={
+                'abstract': False,
+                'indexes': [models.Index(fields=['player_id', 'season', 'game_date', 'game_id'], name='app_playergamebatting_as_of')],
+                'constraints': [models.UniqueConstraint(fields=('player_id', 'game_id'), name='app_playergamebatting_player_game')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PlayerGameFielding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.IntegerField()),
+                ('game_date', models.DateField()),
+                ('games', models.IntegerField(default=0)),
+                ('po', models.IntegerField(default=0)),
+                ('a', models.IntegerField(default=0)),
+                ('e', models.IntegerField(default=0)),
+                ('catchers_interference', models.IntegerField(default=0)),
+                ('pb', models.IntegerField(default=0)),
+                ('sba', models.IntegerField(default=0)),
+                ('cs', models.IntegerField(default=0)),
+                ('dp', models.IntegerField(default=0)),
+                ('tp', models.IntegerField(default=0)),
+                ('game_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.gameinfo')),
+                ('player_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.playerinfo')),
+            ],
+            options={
+                'abstract': False,
+                'indexes': [models.Index(fields=['player_id', 'season', 'game_date', 'game_id'], name='app_playergamefielding_as_of')],
+                'constraints': [models.UniqueConstraint(fields=('player_id', 'game_id'), name='app_playergamefielding_player_game')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PlayerGamePitching',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.IntegerField()),
+                ('game_date', models.DateField()),
+                ('games', models.IntegerField(default=0)),
+                ('starter', models.IntegerField(default=0)),
+                ('outs', models.IntegerField(default=0)),
+                ('h', models.IntegerField(default=0)),
+                ('r', models.IntegerField(default=0)),
+                ('er', models.IntegerField(default=0)),
+                ('bb', models.IntegerField(default=0)),
+                ('so', models.IntegerField(default=0)),
+                ('bf', models.IntegerField(default=0)),
+                ('doubles_allowed', models.IntegerField(default=0)),
+                ('triples_allowed', models.IntegerField(default=0)),
+                ('hr_allowed', models.IntegerField(default=0)),
+                ('wp', models.IntegerField(default=0)),
+                ('hb', models.IntegerField(default=0)),
+                ('ibb', models.IntegerField(default=0)),
+                ('balk', models.IntegerField(default=0)),
+                ('ir', models.IntegerField(default=0)),
+                ('irs', models.IntegerField(default=0)),
+                ('sh_allowed', models.IntegerField(default=0)),
+                ('sf_allowed', models.IntegerField(default=0)),
+                ('kl', models.IntegerField(default=0)),
+                ('pickoffs', models.IntegerField(default=0)),
+                ('win', models.IntegerField(default=0)),
+                ('loss', models.IntegerField(default=0)),
+                ('sv', models.IntegerField(default=0)),
+                ('game_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.gameinfo')),
+                ('player_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.playerinfo')),
+            ],
+            options={
+                'abstract': False,
+                'indexes': [models.Index(fields=['player_id', 'season', 'game_date', 'game_id'], name='app_playergamepitching_as_of')],
+                'constraints': [models.UniqueConstraint(fields=('player_id', 'game_id'), name='app_playergamepitching_player_game')],
+            },
+        ),
+    ]
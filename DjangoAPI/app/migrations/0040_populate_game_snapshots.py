@@ -0,0 +1,76 @@
+from django.db import migrations, models
+from django.db.models.functions import Cast, Substr
+
+BATTING = (
+    "ab", "runs", "hits", "rbi", "bb", "so", "hbp", "ibb", "sb", "cs", "dp",
+    "double", "triple", "hr", "sf", "sh", "picked_off",
+)
+PITCHING = (
+    "starter", "outs", "h", "r", "er", "bb", "so", "bf", "doubles_allowed",
+    "triples_allowed", "hr_allowed", "wp", "hb", "ibb", "balk", "ir", "irs",
+    "sh_allowed", "sf_allowed", "kl", "pickoffs", "win", "loss", "sv",
+)
+FIELDING = (
+    "po", "a", "e", "catchers_interference", "pb", "sba", "cs", "dp", "tp",
+)
+SNAPSHOTS = (
+    ("PlayerGameBatting", "BatterStat", BATTING),
+    ("PlayerGamePitching", "PitcherStat", PITCHING),
+    ("PlayerGameFielding", "FieldingStat", FIELDING),
+)
+
+
+def populate(apps, schema_editor):
+    for snapshot_name, source_name, totals in SNAPSHOTS:
+        Snapshot = apps.get_model("app", snapshot_name)
+        Source = apps.get_model("app", source_name)
+
+        rows = (
+            Source.objects.filter(player_id__isnull=False, game_id__isnull=False)
+            .annotate(
+                # game_date is "YYYY-MM-DD"
+                season=Cast(Substr("game_id__game_date", 1, 4), models.IntegerField())
+            )
+            .values("player_id", "season", "game_id", "game_id__game_date")
+            .annotate(
+                games=models.Count("id"),
+                **{f"total_{field}": models.Sum(field) for field in totals},
+            )
+            .order_by("player_id", "season", "game_id__game_date", "game_id")
+        )
+        snapshots = []
+        running = {}
+        for row in rows:
+            player_season = (row["player_id"], row["season"])
+            if running.get("key") != player_season:
+                running = {"key": player_season, "games": 0, **dict.fromkeys(totals, 0)}
+            running["games"] += row["games"]
+            for field in totals:
+                running[field] += row[f"total_{field}"]
+            snapshots.append(
+                Snapshot(
+                    player_id_id=row["player_id"],
+                    game_id_id=row["game_id"],
+                    season=row["season"],
+                    game_date=row["game_id__game_date"],
+                    games=running["games"],
+                    **{field: running[field] for field in totals},
+                )
+            )
+        Snapshot.objects.bulk_create(snapshots, batch_size=1000)
+
+
+def clear(apps, schema_editor):
+    for snapshot_name, _, _ in SNAPSHOTS:
+        apps.get_model("app", snapshot_name).objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0039_game_snapshots"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, clear),
+    ]
@@ -0,0 +1,63 @@
+from django.db import migrations, models
+from django.db.models.functions import Cast, Substr
+
+FIELDING = (
+    "po", "a", "e", "catchers_interference", "pb", "sba", "cs", "dp", "tp",
+)
+
+
+def repopulate(apps, schema_editor, exclude_pitchers=True):
+    FieldingStat = apps.get_model("app", "FieldingStat")
+    PlayerGameFielding = apps.get_model("app", "PlayerGameFielding")
+
+    rows = FieldingStat.objects.filter(player_id__isnull=False, game_id__isnull=False)
+    if exclude_pitchers:
+        rows = rows.exclude(player_position="P")
+    rows = (
+        rows.annotate(
+            # game_date is "YYYY-MM-DD"
+            season=Cast(Substr("game_id__game_date", 1, 4), models.IntegerField())
+        )
+        .values("player_id", "season", "game_id", "game_id__game_date")
+        .annotate(
+            games=models.Count("id"),
+            **{f"total_{field}": models.Sum(field) for field in FIELDING},
+        )
+        .order_by("player_id", "season", "game_id__game_date", "game_id")
+    )
+    snapshots = []
+    running = {}
+    for row in rows:
+        player_season = (row["player_id"], row["season"])
+        if running.get("key") != player_season:
+            running = {"key": player_season, "games": 0, **dict.fromkeys(FIELDING, 0)}
+        running["games"] += row["games"]
+        for field in FIELDING:
+            running[field] += row[f"total_{field}"]
+        snapshots.append(
+            PlayerGameFielding(
+                player_id_id=row["player_id"],
+                game_id_id=row["game_id"],
+                season=row["season"],
+                game_date=row["game_id__game_date"],
+                games=running["games"],
+                **{field: running[field] for field in FIELDING},
+            )
+        )
+    PlayerGameFielding.objects.all().delete()
+    PlayerGameFielding.objects.bulk_create(snapshots, batch_size=1000)
+
+
+def with_pitchers(apps, schema_editor):
+    repopulate(apps, schema_editor, exclude_pitchers=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0040_populate_game_snapshots"),
+    ]
+
+    operations = [
+        migrations.RunPython(repopulate, with_pitchers),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0041_playergamefielding_without_pitchers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SituationalSplit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('situation', models.CharField(choices=[('with_runners', 'with_runners'), ('hits_with_risp', 'hits_with_risp'), ('vs_lhp', 'vs_lhp'), ('vs_rhp', 'vs_rhp'), ('leadoff_pct', 'leadoff_pct'), ('rbi_runner_on_3rd', 'rbi_runner_on_3rd'), ('h_pinchhit', 'h_pinchhit'), ('runners_advanced', 'runners_advanced'), ('with_two_outs', 'with_two_outs'), ('with_two_runners', 'with_two_runners'), ('with_two_in_scoring', 'with_two_in_scoring'), ('bases_empty', 'bases_empty'), ('bases_loaded', 'bases_loaded')], max_length=20)),
+                ('successes', models.IntegerField(default=0)),
+                ('opportunities', models.IntegerField(default=0)),
+                ('ab', models.IntegerField(default=0)),
+                ('h', models.IntegerField(default=0)),
+                ('r', models.IntegerField(default=0)),
+                ('rbi', models.IntegerField(default=0)),
+                ('bb', models.IntegerField(default=0)),
+                ('k', models.IntegerField(default=0)),
+                ('go', models.IntegerField(default=0)),
+                ('fo', models.IntegerField(default=0)),
+                ('game_id', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='app.gameinfo')),
+                ('player_id', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='app.playerinfo')),
+                ('situational', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.battingsituational')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['player_id', 'situation'], name='situational_split_player')],
+                'constraints': [models.UniqueConstraint(fields=('situational', 'situation'), name='unique_situational_split')],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations
+
+SITUATIONS = (
+    "with_runners", "hits_with_risp", "vs_lhp", "vs_rhp", "leadoff_pct",
+    "rbi_runner_on_3rd", "h_pinchhit", "runners_advanced", "with_two_outs",
+    "with_two_runners", "with_two_in_scoring", "bases_empty", "bases_loaded",
+)
+COUNTS = {
+    "AB": "ab", "H": "h", "R": "r", "RBI": "rbi", "BB": "bb", "K": "k",
+    "GO": "go", "FO": "fo",
+}
+
+
+def parse(stats):
+    # {"succ_opp": "3-7", "AB": 7, "H": 3, ...}; missing keys are 0
+    parsed = {}
+    successes, _, opportunities = str(stats.get("succ_opp", "")).partition("-")
+    for column, value in (("successes", successes), ("opportunities", opportunities)):
+        parsed[column] = int(value) if value.strip().isdigit() else 0
+    for key, column in COUNTS.items():
+        value = stats.get(key, 0)
+        parsed[column] = value if isinstance(value, int) else 0
+    return parsed
+
+
+def populate(apps, schema_editor):
+    BattingSituational = apps.get_model("app", "BattingSituational")
+    SituationalSplit = apps.get_model("app", "SituationalSplit")
+
+    SituationalSplit.objects.bulk_create(
+        (
+            SituationalSplit(
+                situational_id=row.pk,
+                player_id_id=row.player_id_id,
+                game_id_id=row.game_id_id,
+                situation=situation,
+                **parse(getattr(row, situation)),
+            )
+            for row in BattingSituational.objects.iterator()
+            for situation in SITUATIONS
+            if getattr(row, situation)
+        ),
+        batch_size=1000,
+    )
+
+
+def clear(apps, schema_editor):
+    apps.get_model("app", "SituationalSplit").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0042_situationalsplit"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, clear),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:09
+
+from django.db import migrations, models
+
+EXTRA_COUNTS = {"HBP": "hbp", "SF": "sf", "2B": "double", "3B": "triple", "HR": "hr"}
+
+
+def fill_extra_counts(apps, schema_editor):
+    SituationalSplit = apps.get_model("app", "SituationalSplit")
+    splits = []
+    for split in SituationalSplit.objects.select_related("situational").iterator():
+        stats = getattr(split.situational, split.situation) or {}
+        for key, column in EXTRA_COUNTS.items():
+            value = stats.get(key, 0)
+            setattr(split, column, value if isinstance(value, int) else 0)
+        splits.append(split)
+    SituationalSplit.objects.bulk_update(splits, list(EXTRA_COUNTS.values()), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0043_populate_situationalsplit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='situationalsplit',
+            name='double',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='situationalsplit',
+            name='hbp',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='situationalsplit',
+            name='hr',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='situationalsplit',
+            name='sf',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='situationalsplit',
+            name='triple',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(fill_extra_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0044_situationalsplit_extra_counts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='gameinfo',
+            name='game_date',
+            field=models.DateField(db_index=True),
+        ),
+    ]
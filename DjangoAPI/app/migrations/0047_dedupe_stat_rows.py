@@ -0,0 +1,102 @@
+from django.db import migrations, models
+
+BATTING = (
+    "ab", "runs", "hits", "rbi", "bb", "so", "hbp", "ibb", "sb", "cs", "dp",
+    "double", "triple", "hr", "sf", "sh", "picked_off",
+)
+PITCHING = (
+    "starter", "outs", "h", "r", "er", "bb", "so", "bf", "doubles_allowed",
+    "triples_allowed", "hr_allowed", "wp", "hb", "ibb", "balk", "ir", "irs",
+    "sh_allowed", "sf_allowed", "kl", "pickoffs", "win", "loss", "sv",
+)
+FIELDING = (
+    "po", "a", "e", "catchers_interference", "pb", "sba", "cs", "dp", "tp",
+)
+# source, its unique key, and the season/snapshot tables that summed it
+SOURCES = (
+    ("BatterStat", ("player_id", "game_id"), "PlayerSeasonBatting", "PlayerGameBatting", BATTING),
+    ("PitcherStat", ("player_id", "game_id"), "PlayerSeasonPitching", "PlayerGamePitching", PITCHING),
+    (
+        "FieldingStat",
+        ("player_id", "game_id", "player_position"),
+        "PlayerSeasonFielding",
+        "PlayerGameFielding",
+        FIELDING,
+    ),
+    ("BattingSituational", ("player_id", "game_id"), None, None, ()),
+)
+
+
+def duplicates(Source, key):
+    """Every row but the latest upload of each key that has more than one."""
+    groups = (
+        Source.objects.filter(player_id__isnull=False, game_id__isnull=False)
+        .values(*key)
+        .annotate(keep=models.Max("id"), rows=models.Count("id"))
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for group in groups:
+        yield from (
+            Source.objects.filter(**{field: group[field] for field in key})
+            .exclude(id=group["keep"])
+            .select_related("game_id")
+        )
+
+
+def take_back(stat, Season, Snapshot, totals):
+    """What SeasonTotals.apply/GameSnapshot.apply do with sign=-1. The kept
+    row is for the same game, so no season or snapshot row goes away."""
+    game = stat.game_id
+    change = {
+        "games": models.F("games") - 1,
+        **{field: models.F(field) - getattr(stat, field) for field in totals},
+    }
+    season_key = {
+        "player_id_id": stat.player_id_id,
+        "season": game.game_date.year,
+        "team_id": game.selected_team_id,
+    }
+    if hasattr(stat, "player_position"):
+        season_key["player_position"] = stat.player_position
+    Season.objects.filter(**season_key).update(**change)
+
+    # PlayerGameFielding leaves pitchers out
+    if getattr(stat, "player_position", None) == "P":
+        return
+    Snapshot.objects.filter(
+        models.Q(game_date__gt=game.game_date)
+        | models.Q(game_date=game.game_date, game_id__gte=game.pk),
+        player_id_id=stat.player_id_id,
+        season=game.game_date.year,
+    ).update(**change)
+
+
+def dedupe(apps, schema_editor):
+    for source_name, key, season_name, snapshot_name, totals in SOURCES:
+        Source = apps.get_model("app", source_name)
+        stale = []
+        for stat in duplicates(Source, key):
+            if season_name is not None:
+                take_back(
+                    stat,
+                    apps.get_model("app", season_name),
+                    apps.get_model("app", snapshot_name),
+                    totals,
+                )
+            stale.append(stat.pk)
+        # BattingSituational's SituationalSplit rows go with it
+        for start in range(0, len(stale), 1000):
+            Source.objects.filter(pk__in=stale[start:start + 1000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0046_gameinfo_game_date_datefield"),
+    ]
+
+    operations = [
+        # before the unique constraints, which the duplicates would violate
+        migrations.RunPython(dedupe, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0047_dedupe_stat_rows'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='batterstat',
+            name='game_id',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, to='app.gameinfo'),
+        ),
+        migrations.AlterField(
+            model_name='batterstat',
+            name='player_id',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, to='app.playerinfo'),
+        ),
+        migrations.AlterField(
+            model_name='battingsituational',
+            name='game_id',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, to='app.gameinfo'),
+        ),
+        migrations.AlterField(
+            model_name='battingsituational',
+            name='player_id',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, to='app.playerinfo'),
+        ),
+        migrations.AlterField(
+            model_name='fieldingstat',
+            name='game_id',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, to='app.gameinfo'),
+        ),
+        migrations.AlterField(
+            model_name='fieldingstat',
+            name='player_id',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, to='app.playerinfo'),
+        ),
+        migrations.AlterField(
+            model_name='pitcherstat',
+            name='game_id',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, to='app.gameinfo'),
+        ),
+        migrations.AlterField(
+            model_name='pitcherstat',
+            name='player_id',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, to='app.playerinfo'),
+        ),
+        migrations.AddIndex(
+            model_name='batterstat',
+            index=models.Index(fields=['game_id', 'player_id'], name='batterstat_game_player'),
+        ),
+        migrations.AddIndex(
+            model_name='battingsituational',
+            index=models.Index(fields=['game_id', 'player_id'], name='situational_game_player'),
+        ),
+        migrations.AddIndex(
+            model_name='fieldingstat',
+            index=models.Index(fields=['game_id', 'player_id'], name='fieldingstat_game_player'),
+        ),
+        migrations.AddIndex(
+            model_name='pitcherstat',
+            index=models.Index(fields=['game_id', 'player_id'], name='pitcherstat_game_player'),
+        ),
+        migrations.AddConstraint(
+            model_name='batterstat',
+            constraint=models.UniqueConstraint(fields=('player_id', 'game_id'), name='unique_batterstat_player_game'),
+        ),
+        migrations.AddConstraint(
+            model_name='battingsituational',
+            constraint=models.UniqueConstraint(fields=('player_id', 'game_id'), name='unique_situational_player_game'),
+        ),
+        migrations.AddConstraint(
+            model_name='fieldingstat',
+            constraint=models.UniqueConstraint(fields=('player_id', 'game_id', 'player_position'), name='unique_fieldingstat_player_game_position'),
+        ),
+        migrations.AddConstraint(
+            model_name='pitcherstat',
+            constraint=models.UniqueConstraint(fields=('player_id', 'game_id'), name='unique_pitcherstat_player_game'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0048_stat_player_game_unique'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='batterstat',
+            name='batterstat_game_player',
+        ),
+        migrations.RemoveIndex(
+            model_name='battingsituational',
+            name='situational_game_player',
+        ),
+        migrations.RemoveIndex(
+            model_name='fieldingstat',
+            name='fieldingstat_game_player',
+        ),
+        migrations.RemoveIndex(
+            model_name='pitcherstat',
+            name='pitcherstat_game_player',
+        ),
+        migrations.AddIndex(
+            model_name='batterstat',
+            index=models.Index(fields=['game_id', 'player_id', 'id'], name='batterstat_game_player'),
+        ),
+        migrations.AddIndex(
+            model_name='battingsituational',
+            index=models.Index(fields=['game_id', 'player_id', 'id'], name='situational_game_player'),
+        ),
+        migrations.AddIndex(
+            model_name='fieldingstat',
+            index=models.Index(fields=['game_id', 'player_id', 'id'], name='fieldingstat_game_player'),
+        ),
+        migrations.AddIndex(
+            model_name='pitcherstat',
+            index=models.Index(fields=['game_id', 'player_id', 'id'], name='pitcherstat_game_player'),
+        ),
+    ]
@@ -1,7 +1,45 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Coalesce, ExtractYear
 
 # Create your models here.
 
+def season_of(game):
+    return game.game_date.year
+
+
+class SeasonTotalsSource:
+    # Keeps the SeasonTotals and GameSnapshot tables named in `season_totals`
+    # current, in the same transaction as the row itself: the stored row is taken back and
+    # the new one added. QuerySet.update()/delete()/bulk_create() and game
+    # cascades bypass this; `manage.py rebuild_stats` recomputes the tables.
+    season_totals = ()
+
+    def season_totals_models(self):
+        return [
+            self._meta.apps.get_model(self._meta.app_label, name)
+            for name in self.season_totals
+        ]
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            previous = None
+            if self.pk is not None:
+                previous = type(self).objects.filter(pk=self.pk).first()
+            super().save(*args, **kwargs)
+            for totals in self.season_totals_models():
+                if previous is not None:
+                    totals.apply(previous, -1)
+                totals.apply(self, 1)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            stored = type(self).objects.filter(pk=self.pk).first()
+            if stored is not None:
+                for totals in self.season_totals_models():
+                    totals.apply(stored, -1)
+            return super().delete(*args, **kwargs)
+
+
 class PlayerInfo(models.Model):
     player_id = models.AutoField(primary_key=True)
     player_name = models.CharField(max_length=100, unique=True)
@@ -15,17 +53,17 @@ class PlayerInfo(models.Model):
     def __str__(self):
         return f"{self.player_name} (#{self.player_id})"
 
-class BatterStat(models.Model):
+class BatterStat(SeasonTotalsSource, models.Model):
     # nevermind, the id is automatically created
     # not including automatically created ID field 
     #   because the order in which data is input is not useful
     # id = models.AutoField(primary_key=True)
     # An entry in PlayerInfo cannot be deleted if
     #   there's a fielding stat associated with the id
-    player_id = models.ForeignKey(PlayerInfo, on_delete=models.PROTECT, null=True)
+    player_id = models.ForeignKey(PlayerInfo, on_delete=models.PROTECT, null=True, db_index=False)
     # If a game is deleted from GameInfo, the corresponding
     #   batting stats from that game will be deleted as well
-    game_id = models.ForeignKey('GameInfo', on_delete=models.CASCADE, null=True)
+    game_id = models.ForeignKey('GameInfo', on_delete=models.CASCADE, null=True, db_index=False)
     ab = models.IntegerField()
     runs = models.IntegerField()
     hits = models.IntegerField()
@@ -47,12 +85,29 @@ class BatterStat(models.Model):
     def __str__(self):
         return f"{self.player_id.player_name} - Game #{self.game_id} | {self.ab} AB | {self.hits} Hits | {self.runs} Runs"
 
+    season_totals = ("PlayerSeasonBatting", "PlayerGameBatting")
+
+    class Meta:
+        # one line per player and game: the player's log in game order, and
+        # the upsert key the create view writes through. The game-first
+        # index serves a game's box score and the game-log cursor's
+        # (game_id, player_id, id) order; together they stand in for the
+        # single-column foreign key indexes.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["player_id", "game_id"], name="unique_batterstat_player_game"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["game_id", "player_id", "id"], name="batterstat_game_player"),
+        ]
+
     # def __str__(self):
     #     return f"{self.player_id.player_name} ({self.game_id} - {self.ab} AB - {self.hits} Hits - {self.runs} Runs"
 
 class BattingSituational(models.Model):
-    player_id = models.ForeignKey(PlayerInfo, on_delete=models.PROTECT, null=True)
-    game_id = models.ForeignKey('GameInfo', on_delete=models.CASCADE, null=True)
+    player_id = models.ForeignKey(PlayerInfo, on_delete=models.PROTECT, null=True, db_index=False)
+    game_id = models.ForeignKey('GameInfo', on_delete=models.CASCADE, null=True, db_index=False)
     with_runners = models.JSONField(default={})
     hits_with_risp = models.JSONField(default={})
     vs_lhp = models.JSONField(default={})
@@ -68,18 +123,41 @@ class BattingSituational(models.Model):
     bases_loaded = models.JSONField(default={})
     # with_runners_on = models.JSONField(default=dict, null=False, blank=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["player_id", "game_id"], name="unique_situational_player_game"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["game_id", "player_id", "id"], name="situational_game_player"),
+        ]
+
+    SITUATIONS = (
+        "with_runners", "hits_with_risp", "vs_lhp", "vs_rhp", "leadoff_pct",
+        "rbi_runner_on_3rd", "h_pinchhit", "runners_advanced", "with_two_outs",
+        "with_two_runners", "with_two_in_scoring", "bases_empty", "bases_loaded",
+    )
+
+    # SituationalSplit rows are rebuilt from the JSON fields on every save
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.situationalsplit_set.all().delete()
+            SituationalSplit.objects.bulk_create(SituationalSplit.from_situational(self))
+
 
-class PitcherStat(models.Model):
+class PitcherStat(SeasonTotalsSource, models.Model):
     # nevermind, the id is automatically created
     # not including automatically created ID field 
     #   because the order in which data is input is not useful
     # id = models.AutoField(primary_key=True)
     # A player in PlayerInfo cannot be deleted if
     #   there's a pitcher stat associated with the id
-    player_id = models.ForeignKey(PlayerInfo, on_delete=models.PROTECT, null=True)
+    player_id = models.ForeignKey(PlayerInfo, on_delete=models.PROTECT, null=True, db_index=False)
     # If a game is deleted from GameInfo, the corresponding
     #   pitching stats from that game will be deleted as well
-    game_id = models.ForeignKey('GameInfo', on_delete=models.CASCADE, null=True)
+    game_id = models.ForeignKey('GameInfo', on_delete=models.CASCADE, null=True, db_index=False)
     starter = models.IntegerField(default=0)
     # ip = models.DecimalField(max_digits=4, decimal_places=1)
     outs = models.IntegerField()
@@ -106,22 +184,34 @@ class PitcherStat(models.Model):
     loss = models.IntegerField(default=0)
     sv = models.IntegerField(default=0)
 
+    season_totals = ("PlayerSeasonPitching", "PlayerGamePitching")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["player_id", "game_id"], name="unique_pitcherstat_player_game"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["game_id", "player_id", "id"], name="pitcherstat_game_player"),
+        ]
+
     def __str__(self):
         return f"{self.player_id.player_name} - Game #{self.game_id} | {self.ip} IP | {self.h} Hits | {self.r} Runs | {self.er} Earned Runs"
 
-class FieldingStat(models.Model):
+class FieldingStat(SeasonTotalsSource, models.Model):
     # nevermind, the id is automatically created
     # not including automatically created ID field 
     #   because the order in which data is input is not useful
     # id = models.AutoField(primary_key=True)
     # A player in PlayerInfo cannot be deleted if
     #   there's a fielding stat associated with the id
-    player_id = models.ForeignKey(PlayerInfo, on_delete=models.PROTECT, null=True)
+    player_id = models.ForeignKey(PlayerInfo, on_delete=models.PROTECT, null=True, db_index=False)
     # If a game is deleted from GameInfo, the corresponding
     #   fielding stats from that game will be deleted as well
     # game_number = models.IntegerField()
     # year = models.IntegerField()
-    game_id = models.ForeignKey('GameInfo', on_delete=models.CASCADE, null=True)
+    game_id = models.ForeignKey('GameInfo', on_delete=models.CASCADE, null=True, db_index=False)
 
     player_position = models.CharField(max_length=7)
     po = models.IntegerField()
@@ -134,6 +224,20 @@ class FieldingStat(models.Model):
     dp = models.IntegerField()
     tp = models.IntegerField()
 
+    season_totals = ("PlayerSeasonFielding", "PlayerGameFielding")
+
+    class Meta:
+        # a player has one line per position played in a game
+        constraints = [
+            models.UniqueConstraint(
+                fields=["player_id", "game_id", "player_position"],
+                name="unique_fieldingstat_player_game_position",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["game_id", "player_id", "id"], name="fieldingstat_game_player"),
+        ]
+
     def __str__(self):
         return f"{self.player_id.player_name} - Game #{self.game_id} | {self.player_position} | {self.po} PO | {self.a} A | {self.e} E"
 
@@ -160,7 +264,7 @@ class GameInfo(models.Model):
     # year = models.IntegerField()
     # game_number = models.IntegerField()
     game_id = models.IntegerField(primary_key=True)
-    game_date = models.CharField(max_length=15)
+    game_date = models.DateField(db_index=True)
     selected_team = models.ForeignKey(SchoolInfo, on_delete=models.CASCADE, related_name='selected_team', null=True)
     opponent = models.ForeignKey(SchoolInfo, on_delete=models.CASCADE, related_name='opponent', null=True)
     selected_team_home = models.BooleanField()
@@ -183,3 +287,565 @@ class GameInfo(models.Model):
 
     def __str__(self):
         return f"Game #{self.game_id} - {self.selected_team} vs {self.opponent} on {self.game_date}"
+
+
+class SeasonTotals(models.Model):
+    # Sums of a stat model's columns (TOTALS, named as on the source) per
+    # player, season and team, so the team tables read one row per
+    # player-season instead of every game line. The unique key leads with
+    # season, so a season is one index range.
+    source = None
+    TOTALS = ()
+
+    player_id = models.ForeignKey(PlayerInfo, on_delete=models.CASCADE)
+    season = models.IntegerField()
+    team = models.ForeignKey(SchoolInfo, on_delete=models.CASCADE, null=True)
+    games = models.IntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def key(cls, stat):
+        game = stat.game_id
+        return {
+            "player_id_id": stat.player_id_id,
+            "season": season_of(game),
+            "team_id": game.selected_team_id,
+        }
+
+    @classmethod
+    def apply(cls, stat, sign):
+        """Add (sign=1) or take back (sign=-1) one source row."""
+        if stat.player_id_id is None or stat.game_id_id is None:
+            return
+        key = cls.key(stat)
+        cls.objects.get_or_create(**key)
+        cls.objects.filter(**key).update(
+            games=models.F("games") + sign,
+            **{
+                field: models.F(field) + sign * getattr(stat, field)
+                for field in cls.TOTALS
+            },
+        )
+        if sign < 0:
+            cls.objects.filter(**key, games__lte=0).delete()
+
+    @classmethod
+    def key_lookups(cls):
+        """`key()` as lookups on the source model."""
+        return {
+            "player_id_id": "player_id",
+            "season": "season",
+            "team_id": "game_id__selected_team",
+        }
+
+    @classmethod
+    def from_source(cls, queryset=None):
+        """Unsaved rows summed straight from the source rows."""
+        if queryset is None:
+            queryset = cls.source.objects.all()
+        lookups = cls.key_lookups()
+        rows = (
+            queryset.filter(player_id__isnull=False, game_id__isnull=False)
+            .annotate(
+                season=ExtractYear("game_id__game_date")
+            )
+            .values(*lookups.values())
+            .annotate(
+                row_games=models.Count("id"),
+                **{f"total_{field}": models.Sum(field) for field in cls.TOTALS},
+            )
+            .order_by()
+        )
+        return [
+            cls(
+                games=row["row_games"],
+                **{attname: row[lookup] for attname, lookup in lookups.items()},
+                **{field: row[f"total_{field}"] for field in cls.TOTALS},
+            )
+            for row in rows
+        ]
+
+    def totals(self):
+        return (self.games, *[getattr(self, field) for field in self.TOTALS])
+
+    def key_tuple(self):
+        return tuple(getattr(self, attname) for attname in self.key_lookups())
+
+
+class PlayerSeasonBatting(SeasonTotals):
+    source = BatterStat
+    TOTALS = (
+        "ab", "runs", "hits", "rbi", "bb", "so", "hbp", "ibb", "sb", "cs", "dp",
+        "double", "triple", "hr", "sf", "sh", "picked_off",
+    )
+
+    ab = models.IntegerField(default=0)
+    runs = models.IntegerField(default=0)
+    hits = models.IntegerField(default=0)
+    rbi = models.IntegerField(default=0)
+    bb = models.IntegerField(default=0)
+    so = models.IntegerField(default=0)
+    hbp = models.IntegerField(default=0)
+    ibb = models.IntegerField(default=0)
+    sb = models.IntegerField(default=0)
+    cs = models.IntegerField(default=0)
+    dp = models.IntegerField(default=0)
+    double = models.IntegerField(default=0)
+    triple = models.IntegerField(default=0)
+    hr = models.IntegerField(default=0)
+    sf = models.IntegerField(default=0)
+    sh = models.IntegerField(default=0)
+    picked_off = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["season", "team", "player_id"], name="unique_player_season_batting"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.player_id_id} - {self.season} | {self.games} G | {self.ab} AB | {self.hits} Hits"
+
+
+class PlayerSeasonPitching(SeasonTotals):
+    source = PitcherStat
+    TOTALS = (
+        "starter", "outs", "h", "r", "er", "bb", "so", "bf", "doubles_allowed",
+        "triples_allowed", "hr_allowed", "wp", "hb", "ibb", "balk", "ir", "irs",
+        "sh_allowed", "sf_allowed", "kl", "pickoffs", "win", "loss", "sv",
+    )
+
+    starter = models.IntegerField(default=0)
+    outs = models.IntegerField(default=0)
+    h = models.IntegerField(default=0)
+    r = models.IntegerField(default=0)
+    er = models.IntegerField(default=0)
+    bb = models.IntegerField(default=0)
+    so = models.IntegerField(default=0)
+    bf = models.IntegerField(default=0)
+    doubles_allowed = models.IntegerField(default=0)
+    triples_allowed = models.IntegerField(default=0)
+    hr_allowed = models.IntegerField(default=0)
+    wp = models.IntegerField(default=0)
+    hb = models.IntegerField(default=0)
+    ibb = models.IntegerField(default=0)
+    balk = models.IntegerField(default=0)
+    ir = models.IntegerField(default=0)
+    irs = models.IntegerField(default=0)
+    sh_allowed = models.IntegerField(default=0)
+    sf_allowed = models.IntegerField(default=0)
+    kl = models.IntegerField(default=0)
+    pickoffs = models.IntegerField(default=0)
+    win = models.IntegerField(default=0)
+    loss = models.IntegerField(default=0)
+    sv = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["season", "team", "player_id"], name="unique_player_season_pitching"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.player_id_id} - {self.season} | {self.games} G | {self.outs} Outs | {self.er} ER"
+
+
+class PlayerSeasonFielding(SeasonTotals):
+    # split by position as well: one row per position a player has played
+    source = FieldingStat
+    TOTALS = (
+        "po", "a", "e", "catchers_interference", "pb", "sba", "cs", "dp", "tp",
+    )
+
+    player_position = models.CharField(max_length=7)
+    po = models.IntegerField(default=0)
+    a = models.IntegerField(default=0)
+    e = models.IntegerField(default=0)
+    catchers_interference = models.IntegerField(default=0)
+    pb = models.IntegerField(default=0)
+    sba = models.IntegerField(default=0)
+    cs = models.IntegerField(default=0)
+    dp = models.IntegerField(default=0)
+    tp = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["season", "team", "player_id", "player_position"],
+                name="unique_player_season_fielding",
+            )
+        ]
+
+    @classmethod
+    def key(cls, stat):
+        return {**super().key(stat), "player_position": stat.player_position}
+
+    @classmethod
+    def key_lookups(cls):
+        return {**super().key_lookups(), "player_position": "player_position"}
+
+    def __str__(self):
+        return f"{self.player_id_id} - {self.season} {self.player_position} | {self.games} G | {self.po} PO | {self.a} A | {self.e} E"
+
+
+class GameSnapshot(models.Model):
+    # A player's season-to-date sums of a stat model's columns (TOTALS) as
+    # of each game they appear in, so "the season as of a date" is the
+    # latest snapshot on or before it: one lookup on the as_of index.
+    # Games are ordered by (game_date, game_id); a game ingested out of
+    # order shifts every later snapshot of the season.
+    source = None
+    TOTALS = ()
+    # the source rows that count: `counted` filters a queryset, counts()
+    # checks a single row
+    counted = models.Q()
+
+    player_id = models.ForeignKey(PlayerInfo, on_delete=models.CASCADE)
+    game_id = models.ForeignKey(GameInfo, on_delete=models.CASCADE)
+    season = models.IntegerField()
+    game_date = models.DateField()
+    games = models.IntegerField(default=0)
+
+    class Meta:
+        abstract = True
+        constraints = [
+            models.UniqueConstraint(
+                fields=["player_id", "game_id"], name="%(app_label)s_%(class)s_player_game"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["player_id", "season", "game_date", "game_id"],
+                name="%(app_label)s_%(class)s_as_of",
+            )
+        ]
+
+    @classmethod
+    def as_of(cls, player_id, date):
+        """The player's snapshot for the season of `date`, as of that day."""
+        return (
+            cls.objects.filter(player_id=player_id, season=date.year, game_date__lte=date)
+            .order_by("-game_date", "-game_id")
+            .first()
+        )
+
+    @classmethod
+    def source_relation(cls):
+        """A source row's snapshot, for source.objects.annotate(snapshot=...):
+        one join on the (player, game) key, read as snapshot__<column>.
+        Unlike a window over the rows a request returns, it doesn't change
+        with the request's filters."""
+        relation = f"game_id__{cls._meta.model_name}"
+        return models.FilteredRelation(
+            relation, condition=models.Q(**{f"{relation}__player_id": models.F("player_id")})
+        )
+
+    @classmethod
+    def between(cls, rows, start, end):
+        """`rows` (keyed on player_id and season, e.g. PlayerSeason* rows)
+        cut to one per player-season in the years of start..end, each
+        joined to that season's snapshot as of `end` (as `as_of_end`) and
+        as of the day before `start` (as `before_start`). Read the range's
+        totals with change(); each join is one lookup on the as_of index
+        however many columns are read through it.
+        """
+        player_season = {
+            "player_id": models.OuterRef("player_id"),
+            "season": models.OuterRef("season"),
+        }
+        relation = f"player_id__{cls._meta.model_name}"
+
+        def as_of(**game_date):
+            latest = (
+                cls.objects.filter(**player_season, **game_date)
+                .order_by("-game_date", "-game_id")
+                .values("pk")[:1]
+            )
+            return models.FilteredRelation(
+                relation, condition=models.Q(**{f"{relation}__pk": models.Subquery(latest)})
+            )
+
+        return (
+            rows.filter(season__gte=start.year, season__lte=end.year)
+            .exclude(models.Exists(rows.filter(**player_season, pk__lt=models.OuterRef("pk"))))
+            .annotate(as_of_end=as_of(game_date__lte=end), before_start=as_of(game_date__lt=start))
+        )
+
+    @staticmethod
+    def change(column):
+        """`column`'s total over the range joined by between()."""
+        return Coalesce(models.F(f"as_of_end__{column}"), 0) - Coalesce(
+            models.F(f"before_start__{column}"), 0
+        )
+
+    @classmethod
+    def counts(cls, stat):
+        return True
+
+    @classmethod
+    def source_rows(cls):
+        return cls.source.objects.filter(cls.counted)
+
+    @classmethod
+    def apply(cls, stat, sign):
+        """Add (sign=1) or take back (sign=-1) one source row."""
+        if stat.player_id_id is None or stat.game_id_id is None or not cls.counts(stat):
+            return
+        game = stat.game_id
+        season = cls.objects.filter(player_id_id=stat.player_id_id, season=season_of(game))
+        from_game = models.Q(game_date__gt=game.game_date) | models.Q(
+            game_date=game.game_date, game_id__gte=game.pk
+        )
+
+        if sign > 0 and not season.filter(game_id=game.pk).exists():
+            # start from the snapshot of the player's previous game
+            previous = season.exclude(from_game).order_by("-game_date", "-game_id").first()
+            cls.objects.create(
+                player_id_id=stat.player_id_id,
+                game_id=game,
+                season=season_of(game),
+                game_date=game.game_date,
+                games=previous.games if previous else 0,
+                **{
+                    field: getattr(previous, field) if previous else 0
+                    for field in cls.TOTALS
+                },
+            )
+
+        season.filter(from_game).update(
+            games=models.F("games") + sign,
+            **{
+                field: models.F(field) + sign * getattr(stat, field)
+                for field in cls.TOTALS
+            },
+        )
+
+        if sign < 0 and not (
+            cls.source_rows()
+            .filter(player_id=stat.player_id_id, game_id=game.pk)
+            .exclude(pk=stat.pk)
+            .exists()
+        ):
+            season.filter(game_id=game.pk).delete()
+
+    @classmethod
+    def from_source(cls, queryset=None):
+        """Unsaved snapshots summed straight from the source rows."""
+        if queryset is None:
+            queryset = cls.source.objects.all()
+        rows = (
+            queryset.filter(cls.counted, player_id__isnull=False, game_id__isnull=False)
+            .annotate(
+                season=ExtractYear("game_id__game_date")
+            )
+            .values("player_id", "season", "game_id", "game_id__game_date")
+            .annotate(
+                row_games=models.Count("id"),
+                **{f"total_{field}": models.Sum(field) for field in cls.TOTALS},
+            )
+            .order_by("player_id", "season", "game_id__game_date", "game_id")
+        )
+        snapshots = []
+        running = None
+        for row in rows:
+            if running is None or (running.player_id_id, running.season) != (
+                row["player_id"], row["season"]
+            ):
+                running = cls(games=0, **{field: 0 for field in cls.TOTALS})
+            running = cls(
+                player_id_id=row["player_id"],
+                game_id_id=row["game_id"],
+                season=row["season"],
+                game_date=row["game_id__game_date"],
+                games=running.games + row["row_games"],
+                **{
+                    field: getattr(running, field) + row[f"total_{field}"]
+                    for field in cls.TOTALS
+                },
+            )
+            snapshots.append(running)
+        return snapshots
+
+    def totals(self):
+        return (self.games, *[getattr(self, field) for field in self.TOTALS])
+
+    def key_tuple(self):
+        return (self.player_id_id, self.game_id_id)
+
+
+class PlayerGameBatting(GameSnapshot):
+    source = BatterStat
+    TOTALS = PlayerSeasonBatting.TOTALS
+
+    ab = models.IntegerField(default=0)
+    runs = models.IntegerField(default=0)
+    hits = models.IntegerField(default=0)
+    rbi = models.IntegerField(default=0)
+    bb = models.IntegerField(default=0)
+    so = models.IntegerField(default=0)
+    hbp = models.IntegerField(default=0)
+    ibb = models.IntegerField(default=0)
+    sb = models.IntegerField(default=0)
+    cs = models.IntegerField(default=0)
+    dp = models.IntegerField(default=0)
+    double = models.IntegerField(default=0)
+    triple = models.IntegerField(default=0)
+    hr = models.IntegerField(default=0)
+    sf = models.IntegerField(default=0)
+    sh = models.IntegerField(default=0)
+    picked_off = models.IntegerField(default=0)
+
+
+class PlayerGamePitching(GameSnapshot):
+    source = PitcherStat
+    TOTALS = PlayerSeasonPitching.TOTALS
+
+    starter = models.IntegerField(default=0)
+    outs = models.IntegerField(default=0)
+    h = models.IntegerField(default=0)
+    r = models.IntegerField(default=0)
+    er = models.IntegerField(default=0)
+    bb = models.IntegerField(default=0)
+    so = models.IntegerField(default=0)
+    bf = models.IntegerField(default=0)
+    doubles_allowed = models.IntegerField(default=0)
+    triples_allowed = models.IntegerField(default=0)
+    hr_allowed = models.IntegerField(default=0)
+    wp = models.IntegerField(default=0)
+    hb = models.IntegerField(default=0)
+    ibb = models.IntegerField(default=0)
+    balk = models.IntegerField(default=0)
+    ir = models.IntegerField(default=0)
+    irs = models.IntegerField(default=0)
+    sh_allowed = models.IntegerField(default=0)
+    sf_allowed = models.IntegerField(default=0)
+    kl = models.IntegerField(default=0)
+    pickoffs = models.IntegerField(default=0)
+    win = models.IntegerField(default=0)
+    loss = models.IntegerField(default=0)
+    sv = models.IntegerField(default=0)
+
+
+class PlayerGameFielding(GameSnapshot):
+    # all positions played in the game together, except pitcher, which the
+    # fielding logs and team fielding table leave out as well
+    source = FieldingStat
+    TOTALS = PlayerSeasonFielding.TOTALS
+    counted = ~models.Q(player_position="P")
+
+    @classmethod
+    def counts(cls, stat):
+        return stat.player_position != "P"
+
+    po = models.IntegerField(default=0)
+    a = models.IntegerField(default=0)
+    e = models.IntegerField(default=0)
+    catchers_interference = models.IntegerField(default=0)
+    pb = models.IntegerField(default=0)
+    sba = models.IntegerField(default=0)
+    cs = models.IntegerField(default=0)
+    dp = models.IntegerField(default=0)
+    tp = models.IntegerField(default=0)
+
+
+class SituationalSplit(models.Model):
+    # One typed row per situation of a BattingSituational row, parsed from
+    # its tooltip dict ({"succ_opp": "3-7", "AB": 7, "H": 3, "RBI": 2}) so
+    # situations can be summed in SQL. Keys missing from the dict are 0.
+    COUNTS = {
+        "AB": "ab", "H": "h", "R": "r", "RBI": "rbi", "BB": "bb", "K": "k",
+        "GO": "go", "FO": "fo", "HBP": "hbp", "SF": "sf", "2B": "double",
+        "3B": "triple", "HR": "hr",
+    }
+
+    source = BattingSituational
+
+    situational = models.ForeignKey(BattingSituational, on_delete=models.CASCADE)
+    player_id = models.ForeignKey(PlayerInfo, on_delete=models.CASCADE, null=True)
+    game_id = models.ForeignKey(GameInfo, on_delete=models.CASCADE, null=True)
+    situation = models.CharField(
+        max_length=20, choices=[(name, name) for name in BattingSituational.SITUATIONS]
+    )
+    successes = models.IntegerField(default=0)
+    opportunities = models.IntegerField(default=0)
+    ab = models.IntegerField(default=0)
+    h = models.IntegerField(default=0)
+    r = models.IntegerField(default=0)
+    rbi = models.IntegerField(default=0)
+    bb = models.IntegerField(default=0)
+    k = models.IntegerField(default=0)
+    go = models.IntegerField(default=0)
+    fo = models.IntegerField(default=0)
+    hbp = models.IntegerField(default=0)
+    sf = models.IntegerField(default=0)
+    double = models.IntegerField(default=0)
+    triple = models.IntegerField(default=0)
+    hr = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["situational", "situation"], name="unique_situational_split"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["player_id", "situation"], name="situational_split_player"),
+        ]
+
+    @staticmethod
+    def parse(stats):
+        """Typed columns for one situation's tooltip dict, None if empty."""
+        if not stats:
+            return None
+        parsed = {}
+        successes, _, opportunities = str(stats.get("succ_opp", "")).partition("-")
+        for column, value in (("successes", successes), ("opportunities", opportunities)):
+            parsed[column] = int(value) if value.strip().isdigit() else 0
+        for key, column in SituationalSplit.COUNTS.items():
+            value = stats.get(key, 0)
+            parsed[column] = value if isinstance(value, int) else 0
+        return parsed
+
+    @classmethod
+    def from_situational(cls, situational):
+        splits = []
+        for situation in BattingSituational.SITUATIONS:
+            parsed = cls.parse(getattr(situational, situation))
+            if parsed is not None:
+                splits.append(
+                    cls(
+                        situational=situational,
+                        player_id_id=situational.player_id_id,
+                        game_id_id=situational.game_id_id,
+                        situation=situation,
+                        **parsed,
+                    )
+                )
+        return splits
+
+    @classmethod
+    def from_source(cls, queryset=None):
+        """Unsaved splits parsed straight from the BattingSituational rows."""
+        if queryset is None:
+            queryset = cls.source.objects.all()
+        return [
+            split
+            for situational in queryset.iterator()
+            for split in cls.from_situational(situational)
+        ]
+
+    def totals(self):
+        return (
+            self.player_id_id, self.game_id_id, self.successes, self.opportunities,
+            *[getattr(self, column) for column in self.COUNTS.values()],
+        )
+
+    def key_tuple(self):
+        return (self.situational_id, self.situation)
+
+    def __str__(self):
+        return f"{self.player_id_id} - Game #{self.game_id_id} | {self.situation} | {self.successes}-{self.opportunities}"
@@ -0,0 +1,38 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class GameLogCursorPagination(CursorPagination):
+    """Keyset pagination for the game-log endpoints.
+
+    Pages are ordered by (game_id, player_id, id), which the stat tables'
+    game-first indexes cover, and each page filters on the cursor's game_id
+    instead of using an OFFSET, so a deep page costs the same as the first.
+    The running totals come from the joined game snapshots, so they don't
+    depend on which page a row lands on. Views can override the ordering
+    with `cursor_ordering`.
+
+    Requests filtered down to one player or game (what the player pages
+    ask for) stay unpaginated unless they pass a cursor or page_size.
+    """
+
+    # the FK columns themselves (the *_id fields are ForeignKeys, so their
+    # attnames carry a second _id); the cursor stores the raw game id
+    ordering = ("game_id_id", "player_id_id", "id")
+    page_size = settings.GAME_LOG_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = settings.GAME_LOG_MAX_PAGE_SIZE
+    unpaginated_filters = ("player_id", "game_id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if (
+            self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+            and any(params.get(name) for name in self.unpaginated_filters)
+        ):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(getattr(view, "cursor_ordering", self.ordering))
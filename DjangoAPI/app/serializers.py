@@ -1,8 +1,192 @@
+from functools import cached_property
 from rest_framework import serializers
-from django.db.models import Sum
+from django.db.models import F, Q, Sum
+from django.db.models.functions import Coalesce
 from .models import BatterStat, PitcherStat, \
 PlayerInfo, FieldingStat, GameInfo, BattingSituational, \
-SchoolInfo
+SchoolInfo, PlayerSeasonBatting, PlayerSeasonFielding, \
+PlayerGameBatting, PlayerGamePitching, PlayerGameFielding
+
+
+# Row formulas shared by the game-log serializers and their .values() fast
+# path (fast_serializers.py), so both produce the same output
+
+def format_game_result(total_innings, team_runs, opponent_runs):
+    expected_innings = 9
+    inning_info = f" ({total_innings})" if total_innings != expected_innings else ''
+    return f"{"W" if team_runs > opponent_runs else "L"} {team_runs}-{opponent_runs}{inning_info}"
+
+def plate_appearances(ab, bb, hbp, ibb, sh, sf):
+    return ab + bb + hbp + ibb + sh + sf
+
+def total_bases(hits, double, triple, hr):
+    return (
+        (hits - double - triple - hr) +
+        (double * 2) +
+        (triple * 3) +
+        (hr * 4)
+    )
+
+def at_bats_against(bf, bb, hb, ibb, sf_allowed, sh_allowed):
+    return bf -  bb - hb - ibb - sf_allowed - sh_allowed
+
+def pitcher_decision(win, loss, sv, total_wins, total_losses, total_saves):
+    win_loss = "W" if win else "L" if loss else "S" if sv else "ND"
+    if win or loss:
+        return f'{win_loss} ({int(total_wins)}-{int(total_losses)})'
+    elif sv:
+        return f'{win_loss} ({int(total_saves)})'
+    else:
+        return " -"
+
+def fielding_pct(fielded, chances):
+    return fielded / chances if chances > 0 else None
+
+def ratio(numerator, denominator):
+    return numerator / denominator if denominator > 0 else None
+
+def batting_average(hits, ab):
+    return ratio(hits, ab)
+
+def on_base_pct(hits, bb, hbp, ibb, ab, sf):
+    return ratio(hits + bb + hbp + ibb, ab + hbp + ibb + bb + sf)
+
+def slugging_pct(tb, ab):
+    return ratio(tb, ab)
+
+def on_base_plus_slugging(hits, bb, hbp, ibb, ab, sf, tb):
+    obp = on_base_pct(hits, bb, hbp, ibb, ab, sf)
+    slg = slugging_pct(tb, ab)
+    return obp + slg if (obp and slg) else None
+
+def earned_run_avg(er, outs):
+    return ratio(er * 27, outs)
+
+def walks_hits_per_inning(bb, ibb, h, outs):
+    return (bb + ibb + h) / (outs / 3) if outs > 0 else None
+
+# Season-to-date sums behind the running columns of the game logs, read
+# from the row's PlayerGame* snapshot joined as `snapshot`
+# (GameSnapshot.source_relation, views.running_total)
+BATTING_RUNNING_TOTALS = {
+    'cum_hits': F('snapshot__hits'),
+    'cum_ab': F('snapshot__ab'),
+    'cum_bb': F('snapshot__bb'),
+    'cum_hbp': F('snapshot__hbp'),
+    'cum_ibb': F('snapshot__ibb'),
+    'cum_sf': F('snapshot__sf'),
+    'cum_tb': (
+        F('snapshot__hits') + F('snapshot__double')
+        + F('snapshot__triple') * 2 + F('snapshot__hr') * 3
+    ),
+}
+PITCHING_RUNNING_TOTALS = {
+    'cum_er': F('snapshot__er'),
+    'cum_outs': F('snapshot__outs'),
+    'cum_bb': F('snapshot__bb'),
+    'cum_ibb': F('snapshot__ibb'),
+    'cum_h': F('snapshot__h'),
+}
+
+def with_running_totals(obj, snapshot_model, running_totals):
+    """Read the running totals for an instance that didn't come through a
+    game-log viewset (e.g. the create views)."""
+    if not hasattr(obj, next(iter(running_totals))):
+        totals = (
+            type(obj).objects
+                .annotate(snapshot=snapshot_model.source_relation())
+                .filter(pk=obj.pk)
+                .values(**{name: Coalesce(expression, 0) for name, expression in running_totals.items()})
+                .first()
+        ) or dict.fromkeys(running_totals, 0)
+        for name, value in totals.items():
+            setattr(obj, name, value)
+    return obj
+
+GAME_RESULT_LOOKUPS = (
+    'game_id__total_innings',
+    'game_id__selected_team_runs',
+    'game_id__opponent_runs',
+)
+
+
+class StatSummaryContext:
+    """Team-wide counts and per-player lookups for one summary response.
+
+    Each value is loaded with a single query the first time a row needs it
+    and then shared by every other row, so a total_* listing costs a fixed
+    number of queries instead of a few per player.
+
+    With a `date_range` (start, end), the counts cover that range only and
+    come from the same as-of snapshots as the range's totals
+    (GameSnapshot.between).
+    """
+
+    def __init__(self, date_range=None):
+        self.date_range = date_range
+
+    @cached_property
+    def total_team_games(self):
+        games = GameInfo.objects.all()
+        if self.date_range is not None:
+            games = games.filter(game_date__range=self.date_range)
+        return games.count()
+
+    @cached_property
+    def player_positions(self):
+        return dict(PlayerInfo.objects.values_list('player_id', 'player_position'))
+
+    @cached_property
+    def fielding_games(self):
+        # games in the field, leaving out pitching like the fielding totals
+        fielding = PlayerSeasonFielding.objects.filter(~Q(player_position='P'))
+        if self.date_range is not None:
+            return dict(
+                PlayerGameFielding.between(fielding, *self.date_range)
+                    .values('player_id')
+                    .annotate(games=Sum(PlayerGameFielding.change('games')))
+                    .values_list('player_id', 'games')
+            )
+        return dict(
+            fielding
+                .values('player_id')
+                .annotate(games=Sum('games'))
+                .values_list('player_id', 'games')
+        )
+
+    @cached_property
+    def plate_appearances(self):
+        if self.date_range is not None:
+            change = PlayerGameBatting.change
+            return dict(
+                PlayerGameBatting.between(PlayerSeasonBatting.objects.all(), *self.date_range)
+                    .values('player_id')
+                    .annotate(total_pa=Sum(change('ab') + change('bb')
+                     + change('hbp') + change('ibb') + change('sf')
+                     + change('sh')))
+                    .values_list('player_id', 'total_pa')
+            )
+        return dict(
+            PlayerSeasonBatting.objects
+                .values('player_id')
+                .annotate(total_pa=Sum('ab') + Sum('bb')
+                 + Sum('hbp') + Sum('ibb') + Sum('sf')
+                 + Sum('sh'))
+                .values_list('player_id', 'total_pa')
+        )
+
+    def all_positions(self, player_id):
+        if player_id in self.player_positions:
+            return [self.player_positions[player_id]]
+        return ["--"]
+
+
+class StatSummaryMixin:
+    @property
+    def summary(self) -> StatSummaryContext:
+        # the context dict belongs to the root (list) serializer, so every
+        # row of a response shares one StatSummaryContext
+        return self.context.setdefault('summary', StatSummaryContext())
 
 class BatterStatSerializer(serializers.ModelSerializer):
     player_name = serializers.CharField(source='player_id.player_name', read_only=True)
@@ -11,44 +195,71 @@ class BatterStatSerializer(serializers.ModelSerializer):
     opponent_name = serializers.CharField(source='game_id.opponent', read_only=True)
     opponent_id = serializers.CharField(source='game_id.opponent.school_id', read_only=True)
     pa = serializers.SerializerMethodField()
-    # avg = serializers.SerializerMethodField()
     tb = serializers.SerializerMethodField()
+    cum_avg = serializers.SerializerMethodField()
+    cum_obp = serializers.SerializerMethodField()
+    cum_slg = serializers.SerializerMethodField()
+    cum_ops = serializers.SerializerMethodField()
     box_score_link = serializers.CharField(source='game_id.box_score_link', read_only=True)
     player_position = serializers.SerializerMethodField()
     home = serializers.BooleanField(source='game_id.selected_team_home', read_only=True)
     school = serializers.CharField(source='game_id.selected_team', read_only=True)
 
+    # lookups and formula behind each method field, for the fast path
+    row_fields = {
+        'game_result': (GAME_RESULT_LOOKUPS, format_game_result),
+        'pa': (('ab', 'bb', 'hbp', 'ibb', 'sh', 'sf'), plate_appearances),
+        'tb': (('hits', 'double', 'triple', 'hr'), total_bases),
+        'player_position': (('fielding_position',), lambda position: position or "--"),
+        'cum_avg': (('cum_hits', 'cum_ab'), batting_average),
+        'cum_obp': (
+            ('cum_hits', 'cum_bb', 'cum_hbp', 'cum_ibb', 'cum_ab', 'cum_sf'),
+            on_base_pct,
+        ),
+        'cum_slg': (('cum_tb', 'cum_ab'), slugging_pct),
+        'cum_ops': (
+            ('cum_hits', 'cum_bb', 'cum_hbp', 'cum_ibb', 'cum_ab', 'cum_sf', 'cum_tb'),
+            on_base_plus_slugging,
+        ),
+    }
+
     def get_pa(self, obj: BatterStat):
-        return obj.ab + obj.bb + obj.hbp + obj.ibb + obj.sh + obj.sf
-
-    # this defines the method used in the SerializerMethodField
-    def get_avg(self, obj: BatterStat):
-        current_ba = (
-            BatterStat.objects
-                .filter(player_id=obj.player_id, game_id__lte=obj.game_id)
-                .aggregate(
-                    total_hits=Sum('hits'),
-                    total_ab=Sum('ab'),
-                )
+        return plate_appearances(obj.ab, obj.bb, obj.hbp, obj.ibb, obj.sh, obj.sf)
+
+    # season-to-date batting line through this game
+    def get_cum_avg(self, obj: BatterStat):
+        obj = with_running_totals(obj, PlayerGameBatting, BATTING_RUNNING_TOTALS)
+        return batting_average(obj.cum_hits, obj.cum_ab)
+
+    def get_cum_obp(self, obj: BatterStat):
+        obj = with_running_totals(obj, PlayerGameBatting, BATTING_RUNNING_TOTALS)
+        return on_base_pct(obj.cum_hits, obj.cum_bb, obj.cum_hbp, obj.cum_ibb, obj.cum_ab, obj.cum_sf)
+
+    def get_cum_slg(self, obj: BatterStat):
+        obj = with_running_totals(obj, PlayerGameBatting, BATTING_RUNNING_TOTALS)
+        return slugging_pct(obj.cum_tb, obj.cum_ab)
+
+    def get_cum_ops(self, obj: BatterStat):
+        obj = with_running_totals(obj, PlayerGameBatting, BATTING_RUNNING_TOTALS)
+        return on_base_plus_slugging(
+            obj.cum_hits, obj.cum_bb, obj.cum_hbp, obj.cum_ibb, obj.cum_ab, obj.cum_sf, obj.cum_tb
         )
-        total_hits = current_ba['total_hits'] or 0
-        total_ab = current_ba['total_ab'] or 0
-        return total_hits / total_ab if total_ab > 0 else None
     
     def get_game_result(self, obj: BatterStat):
-        expected_innings = 9
-        inning_info = f" ({obj.game_id.total_innings})" if obj.game_id.total_innings != expected_innings else ''
-        return f"{"W" if obj.game_id.selected_team_runs > obj.game_id.opponent_runs else "L"} {obj.game_id.selected_team_runs}-{obj.game_id.opponent_runs}{inning_info}"
+        return format_game_result(
+            obj.game_id.total_innings,
+            obj.game_id.selected_team_runs,
+            obj.game_id.opponent_runs,
+        )
 
     def get_tb(self, obj: BatterStat):
-        return (
-            (obj.hits - obj.double - obj.triple - obj.hr) +
-            (obj.double * 2) +
-            (obj.triple * 3) +
-            (obj.hr * 4)
-        )
+        return total_bases(obj.hits, obj.double, obj.triple, obj.hr)
 
     def get_player_position(self, obj: BatterStat):
+        # BatterStatViewSet annotates the position onto every row, only
+        # instances that didn't come from it (e.g. the create view) look it up
+        if hasattr(obj, 'fielding_position'):
+            return obj.fielding_position or "--"
         position_info = (
             FieldingStat.objects
                 .filter(player_id=obj.player_id, game_id=obj.game_id)
@@ -61,6 +272,8 @@ class BatterStatSerializer(serializers.ModelSerializer):
         model = BatterStat
         fields = '__all__'
         read_only_fields = ['id'] + ['player_name']
+        # the create view upserts on the unique (player, game) key instead
+        validators = []
 
 class BatterSituationalSerializer(serializers.ModelSerializer):
     player_name = serializers.CharField(source='player_id.player_name', read_only=True)
@@ -71,8 +284,36 @@ class BatterSituationalSerializer(serializers.ModelSerializer):
         model = BattingSituational
         fields = '__all__'
         read_only_fields = ['id']
+        # the create view upserts on the unique (player, game) key instead
+        validators = []
+
+class SituationalSplitSumSerializer(serializers.Serializer):
+    # player_id and player_name are left out of team-wide rows
+    player_id = serializers.IntegerField(read_only=True)
+    player_name = serializers.CharField(source='player_id__player_name', read_only=True)
+    situation = serializers.CharField(read_only=True)
+    games = serializers.IntegerField(read_only=True)
+    successes = serializers.IntegerField(read_only=True)
+    opportunities = serializers.IntegerField(read_only=True)
+    pct = serializers.SerializerMethodField()
+    ab = serializers.IntegerField(read_only=True)
+    h = serializers.IntegerField(read_only=True)
+    r = serializers.IntegerField(read_only=True)
+    rbi = serializers.IntegerField(read_only=True)
+    bb = serializers.IntegerField(read_only=True)
+    k = serializers.IntegerField(read_only=True)
+    go = serializers.IntegerField(read_only=True)
+    fo = serializers.IntegerField(read_only=True)
+    hbp = serializers.IntegerField(read_only=True)
+    sf = serializers.IntegerField(read_only=True)
+    double = serializers.IntegerField(read_only=True)
+    triple = serializers.IntegerField(read_only=True)
+    hr = serializers.IntegerField(read_only=True)
+
+    def get_pct(self, obj):
+        return ratio(obj['successes'], obj['opportunities'])
 
-class BatterStatSumSerializer(serializers.Serializer):
+class BatterStatSumSerializer(StatSummaryMixin, serializers.Serializer):
     id = serializers.IntegerField(
         read_only=True)
     player_id = serializers.IntegerField(
@@ -101,12 +342,12 @@ class BatterStatSumSerializer(serializers.Serializer):
     total_sh = serializers.IntegerField()
     total_picked_off = serializers.IntegerField()
     total_pa = serializers.SerializerMethodField()
-    avg = serializers.SerializerMethodField()
-    obp = serializers.SerializerMethodField()
-    slg = serializers.SerializerMethodField()
-    tb = serializers.SerializerMethodField()
-    ops = serializers.SerializerMethodField()
-    games = serializers.SerializerMethodField()
+    avg = serializers.FloatField(read_only=True)
+    obp = serializers.FloatField(read_only=True)
+    slg = serializers.FloatField(read_only=True)
+    tb = serializers.IntegerField(read_only=True)
+    ops = serializers.FloatField(read_only=True)
+    games = serializers.IntegerField(source='total_games', read_only=True)
     
     def get_total_pa(self, obj):
         return (
@@ -117,60 +358,15 @@ class BatterStatSumSerializer(serializers.Serializer):
             obj['total_sf'] + 
             obj['total_sh']
         )
-    
-    def get_avg(self, obj):
-        total_hits = obj['total_hits'] or 0
-        total_ab = obj['total_ab'] or 0
-        return total_hits / total_ab if total_ab > 0 else None
-    
-    def get_obp(self, obj):
-        return (
-            (obj['total_hits'] + obj['total_bb']
-         + obj['total_hbp'] + obj['total_ibb'])
-         / (obj['total_ab'] + obj['total_hbp'] 
-          + obj['total_ibb'] + obj['total_bb'] 
-          + obj['total_sf'])
-          ) \
-        if (
-            (obj['total_ab'] + obj['total_hbp'] 
-            + obj['total_ibb'] + obj['total_bb'] 
-            + obj['total_sf']) > 0
-            ) else None
-    def get_tb(self, obj):
-        return (
-            (obj['total_hits'] - obj['total_double']
-            - obj['total_triple'] - obj['total_hr'])
-            + 
-            (obj['total_double'] * 2) + 
-            (obj['total_triple'] * 3) + 
-            (obj['total_hr'] * 4)
-        )
 
-    def get_slg(self, obj):
-        total_bases = self.get_tb(obj)
-        total_ab = obj['total_ab'] or 0
-        return total_bases / total_ab \
-        if total_ab > 0 else None
-    
-    def get_ops(self, obj):
-        obp = self.get_obp(obj)
-        slg = self.get_slg(obj)
-        return obp + slg if (obp and slg) else None
-    
-    def get_games(self, obj):
-        return BatterStat.objects.filter(player_id=obj['player_id']).count()
+    # avg, obp, slg, tb and ops are annotated by TeamBattingStatsViewSet so
+    # they can be filtered and ordered in the database
     
     def get_player_position(self, obj):
-        position_info = (
-            PlayerInfo.objects
-                .filter(player_id=obj['player_id'])
-                .values_list('player_position', flat=True)
-        )
-        if position_info.exists():
-            return list(position_info)
-        return ["--"]
+        return self.summary.all_positions(obj['player_id'])
+
     def get_total_team_games(self, obj):
-        return GameInfo.objects.count()
+        return self.summary.total_team_games
 
 class PitcherStatSerializer(serializers.ModelSerializer):
     player_name = serializers.CharField(source='player_id.player_name', read_only=True)
@@ -183,6 +379,8 @@ class PitcherStatSerializer(serializers.ModelSerializer):
     # era = serializers.SerializerMethodField()
     # outs = serializers.SerializerMethodField()
     decision = serializers.SerializerMethodField()
+    cum_era = serializers.SerializerMethodField()
+    cum_whip = serializers.SerializerMethodField()
     home = serializers.BooleanField(source='game_id.selected_team_home', read_only=True)
     school = serializers.CharField(source='game_id.selected_team', read_only=True)
 
@@ -196,13 +394,27 @@ class PitcherStatSerializer(serializers.ModelSerializer):
     #         outs += (10 * session.ip) - 7 * int(session.ip)
     #     return outs
 
+    # lookups and formula behind each method field, for the fast path
+    row_fields = {
+        'ab': (('bf', 'bb', 'hb', 'ibb', 'sf_allowed', 'sh_allowed'), at_bats_against),
+        'game_result': (GAME_RESULT_LOOKUPS, format_game_result),
+        'decision': (
+            ('win', 'loss', 'sv', 'cum_wins', 'cum_losses', 'cum_saves'),
+            pitcher_decision,
+        ),
+        'cum_era': (('cum_er', 'cum_outs'), earned_run_avg),
+        'cum_whip': (('cum_bb', 'cum_ibb', 'cum_h', 'cum_outs'), walks_hits_per_inning),
+    }
+
     def get_ab(self, obj):
-        return obj.bf -  obj.bb - obj.hb - obj.ibb - obj.sf_allowed - obj.sh_allowed
+        return at_bats_against(obj.bf, obj.bb, obj.hb, obj.ibb, obj.sf_allowed, obj.sh_allowed)
     
     def get_game_result(self, obj: BatterStat):
-        expected_innings = 9
-        inning_info = f" ({obj.game_id.total_innings})" if obj.game_id.total_innings != expected_innings else ''
-        return f"{"W" if obj.game_id.selected_team_runs > obj.game_id.opponent_runs else "L"} {obj.game_id.selected_team_runs}-{obj.game_id.opponent_runs}{inning_info}"
+        return format_game_result(
+            obj.game_id.total_innings,
+            obj.game_id.selected_team_runs,
+            obj.game_id.opponent_runs,
+        )
     # def get_era(self, obj):
     #     stats = (
     #         PitcherStat.objects
@@ -218,30 +430,34 @@ class PitcherStatSerializer(serializers.ModelSerializer):
     #     return (total_er * 27) / total_outs if total_outs > 0 else None
     
     def get_decision(self, obj):
-        win_loss = "W" if obj.win else "L" if obj.loss else "S" if obj.sv else "ND"
-        record = (
-            PitcherStat.objects
-            .filter(player_id=obj.player_id, game_id__lte=obj.game_id)
-            .aggregate(
-                total_wins=Sum('win'),
-                total_losses=Sum('loss'),
-                total_saves=Sum('sv')
-            )
-        )
-        if obj.win or obj.loss:
-            print('WINS:', record['total_wins'])
-            return f'{win_loss} ({int(record["total_wins"])}-{int(record["total_losses"])})'
-        elif obj.sv:
-            return f'{win_loss} ({int(record["total_saves"])})'
-        else:
-            return " -"
+        # PitcherStatViewSet joins the season record from the game's
+        # snapshot, only instances that didn't come from it look it up
+        if not hasattr(obj, 'cum_wins'):
+            snapshot = PlayerGamePitching.objects.filter(
+                player_id=obj.player_id_id, game_id=obj.game_id_id
+            ).first()
+            obj.cum_wins = snapshot.win if snapshot else 0
+            obj.cum_losses = snapshot.loss if snapshot else 0
+            obj.cum_saves = snapshot.sv if snapshot else 0
+        return pitcher_decision(obj.win, obj.loss, obj.sv, obj.cum_wins, obj.cum_losses, obj.cum_saves)
+
+    # season-to-date ERA/WHIP through this appearance
+    def get_cum_era(self, obj):
+        obj = with_running_totals(obj, PlayerGamePitching, PITCHING_RUNNING_TOTALS)
+        return earned_run_avg(obj.cum_er, obj.cum_outs)
+
+    def get_cum_whip(self, obj):
+        obj = with_running_totals(obj, PlayerGamePitching, PITCHING_RUNNING_TOTALS)
+        return walks_hits_per_inning(obj.cum_bb, obj.cum_ibb, obj.cum_h, obj.cum_outs)
 
     class Meta:
         model = PitcherStat
         fields = '__all__'
         read_only_fields = ['id'] + ['player_name']
+        # the create view upserts on the unique (player, game) key instead
+        validators = []
 
-class PitcherStatSumSerializer(serializers.Serializer):
+class PitcherStatSumSerializer(StatSummaryMixin, serializers.Serializer):
     id = serializers.IntegerField(read_only=True)
     player_id = serializers.IntegerField(read_only=True)
     player_name = serializers.CharField(source='player_id__player_name', read_only=True)
@@ -272,8 +488,8 @@ class PitcherStatSumSerializer(serializers.Serializer):
     total_losses = serializers.IntegerField()
     total_saves = serializers.IntegerField()
     total_ab = serializers.SerializerMethodField()
-    total_era = serializers.SerializerMethodField()
-    total_whip = serializers.SerializerMethodField()
+    total_era = serializers.FloatField(read_only=True)
+    total_whip = serializers.FloatField(read_only=True)
     total_games = serializers.IntegerField()
     def get_total_outs(self, obj):
         return obj['total_outs'] if type(obj['total_outs']) == int else None
@@ -287,20 +503,13 @@ class PitcherStatSumSerializer(serializers.Serializer):
             obj['total_sf_allowed'] - 
             obj['total_sh_allowed']
         )
-    def get_total_era(self, obj):
-        total_er = obj['total_er'] or 0
-        return (total_er * 27) / self.get_total_outs(obj) if self.get_total_outs(obj) > 0 else None
 
-    def get_total_whip(self, obj):
-        walks_and_hits = (
-            obj['total_bb'] + 
-            obj['total_ibb'] +
-            obj['total_h']
-        )
-        return walks_and_hits / (self.get_total_outs(obj) / 3) if self.get_total_outs(obj) > 0 else None
+    # total_era and total_whip are annotated by TeamPitchingStatsViewSet so
+    # they can be filtered and ordered in the database
 
     def get_total_team_games(self, obj):
-        return GameInfo.objects.count()
+        return self.summary.total_team_games
+
 class FieldingStatSerializer(serializers.ModelSerializer):
     player_name = serializers.CharField(source='player_id.player_name', read_only=True)
     game_date = serializers.DateField(source='game_id.game_date', read_only=True)
@@ -311,35 +520,39 @@ class FieldingStatSerializer(serializers.ModelSerializer):
     cum_fcpt = serializers.SerializerMethodField()
     school = serializers.CharField(source='game_id.selected_team', read_only=True)
 
+    # lookups and formula behind each method field, for the fast path
+    row_fields = {
+        'game_result': (GAME_RESULT_LOOKUPS, format_game_result),
+        'cum_fcpt': (('cum_fielded', 'cum_chances'), fielding_pct),
+    }
+
     def get_cum_fcpt(self, obj: FieldingStat):
-        current_fcpt = (
-            FieldingStat.objects
-                .filter(player_id=obj.player_id, game_id__lte=obj.game_id)
-                .aggregate(
-                    num=(
-                    (Sum('po') + Sum('a'))),
-                     den=Sum('po') + Sum('a') + Sum('e')
-        )
-    
-        )
-        if current_fcpt['den'] > 0:
-            current_fcpt['total_fcpt'] = current_fcpt['num'] / current_fcpt['den']
-            return float(current_fcpt['total_fcpt'])
-        else:
-            current_fcpt['total_fcpt'] = None
+        # FieldingStatViewSet joins the running totals from the game's
+        # snapshot, only instances that didn't come from it look it up
+        if hasattr(obj, 'cum_chances'):
+            return fielding_pct(obj.cum_fielded, obj.cum_chances)
+        snapshot = PlayerGameFielding.objects.filter(
+            player_id=obj.player_id_id, game_id=obj.game_id_id
+        ).first()
+        if snapshot is None:
             return None
+        return fielding_pct(snapshot.po + snapshot.a, snapshot.po + snapshot.a + snapshot.e)
 
     def get_game_result(self, obj: BatterStat):
-        expected_innings = 9
-        inning_info = f" ({obj.game_id.total_innings})" if obj.game_id.total_innings != expected_innings else ''
-        return f"{"W" if obj.game_id.selected_team_runs > obj.game_id.opponent_runs else "L"} {obj.game_id.selected_team_runs}-{obj.game_id.opponent_runs}{inning_info}"
+        return format_game_result(
+            obj.game_id.total_innings,
+            obj.game_id.selected_team_runs,
+            obj.game_id.opponent_runs,
+        )
     
     class Meta:
         model = FieldingStat
         fields = '__all__'
         read_only_fields = ['id'] + ['player_name']
+        # the create view upserts on the unique (player, game) key instead
+        validators = []
 
-class FieldingStatSumByPosSerializer(serializers.Serializer):
+class FieldingStatSumByPosSerializer(StatSummaryMixin, serializers.Serializer):
     player_name = serializers.CharField(source='player_id__player_name', read_only=True)
     player_id = serializers.IntegerField(read_only=True)
     jersey_number = serializers.IntegerField(source='player_id__jersey_number', read_only=True)
@@ -352,29 +565,12 @@ class FieldingStatSumByPosSerializer(serializers.Serializer):
     total_cs = serializers.IntegerField()
     total_dp = serializers.IntegerField()
     total_tp = serializers.IntegerField()
-    player_position = serializers.CharField(source='all_positions', read_only=True)
+    player_position = serializers.CharField(read_only=True)
     games_at_position = serializers.IntegerField()
     all_positions = serializers.SerializerMethodField()
     
-    def get_player_position(self, obj):
-        # Get all unique positions this player has played
-        positions = (
-            FieldingStat.objects
-            .filter(player_id=obj['player_id'])
-            .values_list('player_position', flat=True)
-            .distinct()
-        )
-        return list(positions)
-    
     def get_all_positions(self, obj):
-        position_info = (
-            PlayerInfo.objects
-                .filter(player_id=obj['player_id'])
-                .values_list('player_position', flat=True)
-        )
-        if position_info.exists():
-            return list(position_info)
-        return ["--"]
+        return self.summary.all_positions(obj['player_id'])
             
 class GameInfoSerializer(serializers.ModelSerializer):
     result = serializers.SerializerMethodField()
@@ -396,7 +592,7 @@ class PlayerInfoSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ['id']
 
-class FieldingStatSumByPlayerSerializer(serializers.Serializer):
+class FieldingStatSumByPlayerSerializer(StatSummaryMixin, serializers.Serializer):
     player_id = serializers.IntegerField(read_only=True)
     player_name = serializers.CharField(source='player_id__player_name', read_only=True)
     jersey_number = serializers.IntegerField(source='player_id__jersey_number', read_only=True)
@@ -415,32 +611,83 @@ class FieldingStatSumByPlayerSerializer(serializers.Serializer):
     all_positions = serializers.SerializerMethodField()
 
     def get_total_team_games(self, obj):
-        return GameInfo.objects.count()
+        return self.summary.total_team_games
     
     def get_total_player_games(self, obj):
-        return FieldingStat.objects.filter(player_id=obj['player_id']).count()
+        return self.summary.fielding_games.get(obj['player_id'], 0)
 
     def get_all_positions(self, obj):
-        position_info = (
-            PlayerInfo.objects
-                .filter(player_id=obj['player_id'])
-                .values_list('player_position', flat=True)
-        )
-        if position_info.exists():
-            return list(position_info)
-        return ["--"]
+        return self.summary.all_positions(obj['player_id'])
+
     def get_total_pa(self, obj):
-        total_pa = (
-            BatterStat.objects
-                .filter(player_id=obj['player_id'])
-                .aggregate(total_pa=Sum('ab') + Sum('bb')
-                 + Sum('hbp') + Sum('ibb') + Sum('sf') 
-                 + Sum('sh'))
-        )
-        return total_pa['total_pa'] if total_pa['total_pa'] else None
+        total_pa = self.summary.plate_appearances.get(obj['player_id'])
+        return total_pa if total_pa else None
     
 class SchoolInfoSerializer(serializers.ModelSerializer):
     class Meta:
         model = SchoolInfo
         fields = '__all__'
-        read_only_fields = ['id']
\ No newline at end of file
+        read_only_fields = ['id']
+
+
+# Season-to-date lines from the PlayerGame* snapshots (StatsAsOfView)
+
+class PlayerGameBattingSerializer(serializers.ModelSerializer):
+    pa = serializers.SerializerMethodField()
+    tb = serializers.SerializerMethodField()
+    avg = serializers.SerializerMethodField()
+    obp = serializers.SerializerMethodField()
+    slg = serializers.SerializerMethodField()
+    ops = serializers.SerializerMethodField()
+
+    def get_pa(self, obj):
+        return plate_appearances(obj.ab, obj.bb, obj.hbp, obj.ibb, obj.sh, obj.sf)
+
+    def get_tb(self, obj):
+        return total_bases(obj.hits, obj.double, obj.triple, obj.hr)
+
+    def get_avg(self, obj):
+        return batting_average(obj.hits, obj.ab)
+
+    def get_obp(self, obj):
+        return on_base_pct(obj.hits, obj.bb, obj.hbp, obj.ibb, obj.ab, obj.sf)
+
+    def get_slg(self, obj):
+        return slugging_pct(self.get_tb(obj), obj.ab)
+
+    def get_ops(self, obj):
+        return on_base_plus_slugging(
+            obj.hits, obj.bb, obj.hbp, obj.ibb, obj.ab, obj.sf, self.get_tb(obj)
+        )
+
+    class Meta:
+        model = PlayerGameBatting
+        exclude = ['id', 'player_id']
+
+class PlayerGamePitchingSerializer(serializers.ModelSerializer):
+    ab = serializers.SerializerMethodField()
+    era = serializers.SerializerMethodField()
+    whip = serializers.SerializerMethodField()
+
+    def get_ab(self, obj):
+        return at_bats_against(obj.bf, obj.bb, obj.hb, obj.ibb, obj.sf_allowed, obj.sh_allowed)
+
+    def get_era(self, obj):
+        return earned_run_avg(obj.er, obj.outs)
+
+    def get_whip(self, obj):
+        return walks_hits_per_inning(obj.bb, obj.ibb, obj.h, obj.outs)
+
+    class Meta:
+        model = PlayerGamePitching
+        exclude = ['id', 'player_id']
+
+class PlayerGameFieldingSerializer(serializers.ModelSerializer):
+    fpct = serializers.SerializerMethodField()
+
+    def get_fpct(self, obj):
+        return fielding_pct(obj.po + obj.a, obj.po + obj.a + obj.e)
+
+    class Meta:
+        model = PlayerGameFielding
+        exclude = ['id', 'player_id']
@@ -1,3 +1,952 @@
+import datetime
+import gzip
+import json
+import threading
+import time
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import QuerySet
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from .caching import bump_ingest_generation, check_cache_backend, single_flight
+from .models import (
+    BatterStat,
+    BattingSituational,
+    FieldingStat,
+    GameInfo,
+    PitcherStat,
+    PlayerInfo,
+    PlayerSeasonBatting,
+    PlayerSeasonPitching,
+    SchoolInfo,
+    SituationalSplit,
+)
+from .pagination import GameLogCursorPagination
+from .warming import client_fetcher, http_fetcher, warm, warm_paths
 
 # Create your tests here.
+
+BATTER_LINE = dict(
+    ab=4, runs=1, hits=2, rbi=1, bb=1, so=1, hbp=0, ibb=0, sb=0, cs=0, dp=0,
+    double=1, triple=0, hr=0, sf=0, sh=0, picked_off=0,
+)
+FIELDING_LINE = dict(
+    po=2, a=3, e=1, catchers_interference=0, pb=0, sba=0, cs=0, dp=1, tp=0,
+)
+PITCHER_LINE = dict(
+    outs=9, h=3, r=1, er=1, bb=1, so=4, bf=13, doubles_allowed=1,
+    triples_allowed=0, hr_allowed=0, wp=0, hb=0, ibb=0, balk=0, ir=0, irs=0,
+    sh_allowed=0, sf_allowed=0, kl=1, pickoffs=0,
+)
+
+
+class StatTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.uva = SchoolInfo.objects.create(school_id=746, school_name="Virginia")
+        cls.opponent = SchoolInfo.objects.create(school_id=1, school_name="Opponent")
+        cls.players = [
+            PlayerInfo.objects.create(player_name=f"Player {n}", jersey_number=n)
+            for n in range(1, 4)
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def add_game(self, number, date=None):
+        game = GameInfo.objects.create(
+            game_id=int(f"2025{number}"),
+            game_date=datetime.date.fromisoformat(date or f"2025-03-{number:02d}"),
+            selected_team=self.uva,
+            opponent=self.opponent,
+            selected_team_home=True,
+            total_innings=9,
+            selected_team_runs=5,
+            opponent_runs=3,
+            selected_team_hits=8,
+            opponent_hits=6,
+            selected_team_errors=1,
+            opponent_errors=2,
+            selected_team_dpt=0,
+            opponent_dpt=1,
+            selected_team_tpt=0,
+            opponent_tpt=0,
+            winning_pitcher="A",
+            losing_pitcher="B",
+            box_score_link=f"/box/{number}",
+            attendance=1000,
+        )
+        for player in self.players:
+            BatterStat.objects.create(player_id=player, game_id=game, **BATTER_LINE)
+            FieldingStat.objects.create(
+                player_id=player, game_id=game, player_position="SS", **FIELDING_LINE
+            )
+        bump_ingest_generation()
+        return game
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response.json()
+
+
+class BatterStatQueryTests(StatTestCase):
+    def test_position_comes_from_fielding_row(self):
+        self.add_game(1)
+        _, page = self.count_queries("/api/batter_stats/")
+        self.assertEqual({row["player_position"] for row in page["results"]}, {"SS"})
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.add_game(1)
+        one_game, page = self.count_queries("/api/batter_stats/")
+        self.assertEqual(len(page["results"]), 3)
+        for number in range(2, 6):
+            self.add_game(number)
+        five_games, page = self.count_queries("/api/batter_stats/")
+        self.assertEqual(len(page["results"]), 15)
+        self.assertEqual(one_game, five_games)
+
+
+class FieldingStatRunningTotalTests(StatTestCase):
+    def test_cum_fcpt_runs_through_each_game(self):
+        self.add_game(1)
+        second = self.add_game(2)
+        # per row, so the snapshots follow
+        for stat in FieldingStat.objects.filter(game_id=second):
+            stat.e = 4
+            stat.save()
+        _, rows = self.count_queries(f"/api/fielding_stats/?player_id={self.players[0].pk}")
+        self.assertEqual([row["cum_fcpt"] for row in rows], [5 / 6, 10 / 15])
+
+        for query in ("game_id=20252", f"player_id={self.players[0].pk}&game_date__gte=2025-03-02"):
+            with self.subTest(query=query):
+                _, rows = self.count_queries(f"/api/fielding_stats/?{query}")
+                self.assertEqual({row["cum_fcpt"] for row in rows}, {10 / 15})
+
+
+class PitcherStatRunningRecordTests(StatTestCase):
+    def test_decision_carries_running_record(self):
+        pitcher = self.players[0]
+        for number, decision in enumerate([dict(win=1), dict(loss=1), {}, dict(sv=1), dict(win=1)], 1):
+            PitcherStat.objects.create(
+                player_id=pitcher, game_id=self.add_game(number), **PITCHER_LINE, **decision
+            )
+        _, rows = self.count_queries(f"/api/pitcher_stats/?player_id={pitcher.pk}")
+        self.assertEqual(
+            [row["decision"] for row in rows],
+            ["W (1-0)", "L (1-1)", " -", "S (1)", "W (2-1)"],
+        )
+
+    def test_filters_dont_change_the_record(self):
+        pitcher = self.players[0]
+        for number, decision in enumerate([dict(win=1), dict(loss=1), dict(win=1)], 1):
+            PitcherStat.objects.create(
+                player_id=pitcher, game_id=self.add_game(number), **PITCHER_LINE, **decision
+            )
+        _, log = self.count_queries(f"/api/pitcher_stats/?player_id={pitcher.pk}")
+        unfiltered = {row["game_id"]: row["decision"] for row in log}
+        self.assertEqual(unfiltered[20253], "W (2-1)")
+
+        for query in ("game_id=20253", "win=1", f"player_id={pitcher.pk}&game_date__gte=2025-03-02"):
+            with self.subTest(query=query):
+                _, rows = self.count_queries(f"/api/pitcher_stats/?{query}")
+                # only player and game filters come back unpaginated
+                rows = rows["results"] if isinstance(rows, dict) else rows
+                self.assertTrue(rows)
+                for row in rows:
+                    self.assertEqual(row["decision"], unfiltered[row["game_id"]])
+
+
+class GameLogQueryBudgetTests(StatTestCase):
+    # queries per listing no matter how many rows it returns (the fast
+    # list path reads the rows, then the school names once)
+    BUDGETS = {
+        "/api/batter_stats/": 2,
+        "/api/pitcher_stats/": 2,
+        "/api/fielding_stats/": 2,
+        "/api/batter_situational_stats/": 1,
+    }
+
+    def test_game_log_endpoints_stay_within_budget(self):
+        for number in range(1, 6):
+            game = self.add_game(number)
+            for player in self.players:
+                PitcherStat.objects.create(player_id=player, game_id=game, **PITCHER_LINE)
+                BattingSituational.objects.create(player_id=player, game_id=game)
+        for url, budget in self.BUDGETS.items():
+            with self.subTest(url=url):
+                queries, page = self.count_queries(url)
+                self.assertEqual(len(page["results"]), 15)
+                self.assertLessEqual(queries, budget)
+
+
+class SummaryQueryTests(StatTestCase):
+    SUMMARY_URLS = [
+        "/api/total_batting_stats/",
+        "/api/total_pitching_stats/",
+        "/api/total_fielding_stats_by_player/",
+        "/api/total_fielding_stats_by_pos/",
+    ]
+
+    def add_pitching(self, game):
+        for player in self.players:
+            PitcherStat.objects.create(player_id=player, game_id=game, **PITCHER_LINE)
+
+    def test_summary_query_count_does_not_grow_with_players(self):
+        self.add_pitching(self.add_game(1))
+        before = {url: self.count_queries(url)[0] for url in self.SUMMARY_URLS}
+        self.players += [
+            PlayerInfo.objects.create(player_name=f"Player {n}", jersey_number=n)
+            for n in range(4, 10)
+        ]
+        self.add_pitching(self.add_game(2))
+        for url in self.SUMMARY_URLS:
+            with self.subTest(url=url):
+                queries, rows = self.count_queries(url)
+                self.assertEqual(len(rows), 9)
+                self.assertEqual(queries, before[url])
+
+    def test_summary_values(self):
+        self.add_game(1)
+        self.add_game(2)
+        _, rows = self.count_queries("/api/total_fielding_stats_by_player/")
+        row = rows[0]
+        self.assertEqual(row["total_team_games"], 2)
+        self.assertEqual(row["total_player_games"], 2)
+        self.assertEqual(row["total_pa"], 10)
+        self.assertEqual(row["all_positions"], [{}])
+
+
+class RateStatTests(StatTestCase):
+    def setUp(self):
+        super().setUp()
+        for number in (1, 2):
+            game = self.add_game(number)
+            for player in self.players:
+                PitcherStat.objects.create(player_id=player, game_id=game, **PITCHER_LINE)
+        # the third player goes 0-for-8 with no walks
+        # (saved one by one, so PlayerSeasonBatting follows)
+        for stat in BatterStat.objects.filter(player_id=self.players[2]):
+            stat.hits = stat.double = stat.bb = 0
+            stat.save()
+
+    def test_rate_stats_match_python_formulas(self):
+        _, rows = self.count_queries("/api/total_batting_stats/")
+        row = next(row for row in rows if row["player_id"] == self.players[0].pk)
+        avg, obp, slg = 4 / 8, (4 + 2) / (8 + 2), (4 + 2) / 8
+        self.assertEqual(
+            (row["avg"], row["obp"], row["slg"], row["tb"], row["ops"]),
+            (avg, obp, slg, 6, obp + slg),
+        )
+        hitless = next(row for row in rows if row["player_id"] == self.players[2].pk)
+        self.assertEqual((hitless["avg"], hitless["ops"]), (0.0, None))
+
+        _, rows = self.count_queries("/api/total_pitching_stats/")
+        self.assertEqual(rows[0]["total_era"], (2 * 27) / 18)
+        self.assertEqual(rows[0]["total_whip"], 8 / (18 / 3))
+
+    def test_order_filter_and_limit_by_rate(self):
+        _, rows = self.count_queries("/api/total_batting_stats/?ordering=-ops")
+        self.assertEqual(rows[-1]["player_id"], self.players[2].pk)
+        _, rows = self.count_queries("/api/total_batting_stats/?ops__gte=.900")
+        self.assertEqual(len(rows), 2)
+        _, page = self.count_queries("/api/total_batting_stats/?ordering=-ops&limit=1")
+        self.assertEqual(page["count"], 3)
+        self.assertEqual(len(page["results"]), 1)
+
+
+class GameLogPaginationTests(StatTestCase):
+    def setUp(self):
+        super().setUp()
+        for number in range(1, 5):
+            game = self.add_game(number)
+            for player in self.players:
+                PitcherStat.objects.create(
+                    player_id=player, game_id=game, win=number % 2, loss=1 - number % 2,
+                    **PITCHER_LINE
+                )
+
+    def walk(self, url):
+        rows = []
+        while url:
+            _, page = self.count_queries(url)
+            rows += page["results"]
+            url = page["next"]
+        return rows
+
+    def test_pages_cover_the_log_in_order(self):
+        expected = [
+            (game.pk, player.pk)
+            for game in GameInfo.objects.order_by("game_id")
+            for player in self.players
+        ]
+        for endpoint in ("batter_stats", "fielding_stats"):
+            rows = self.walk(f"/api/{endpoint}/?page_size=4")
+            self.assertEqual([(row["game_id"], row["player_id"]) for row in rows], expected)
+        games = self.walk("/api/game_info/?page_size=3")
+        self.assertEqual(len(games), 4)
+
+    def test_running_totals_span_pages(self):
+        player = self.players[0].pk
+        _, expected = self.count_queries(f"/api/pitcher_stats/?player_id={player}")
+        rows = self.walk("/api/pitcher_stats/?page_size=5")
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(
+            [row["decision"] for row in rows if row["player_id"] == player],
+            [row["decision"] for row in expected],
+        )
+        self.assertEqual(expected[-1]["decision"], "L (2-2)")
+
+    def test_player_filter_opts_out(self):
+        _, rows = self.count_queries(f"/api/batter_stats/?player_id={self.players[0].pk}")
+        self.assertEqual(len(rows), 4)
+
+
+class FastListTests(StatTestCase):
+    def setUp(self):
+        super().setUp()
+        for number in range(1, 4):
+            game = self.add_game(number)
+            for player in self.players:
+                PitcherStat.objects.create(
+                    player_id=player, game_id=game, win=number % 2, **PITCHER_LINE
+                )
+        GameInfo.objects.filter(game_id=20252).update(total_innings=11, opponent_runs=7)
+        FieldingStat.objects.filter(game_id=20253).delete()
+
+    def test_fast_list_matches_serializer_output(self):
+        from . import views
+
+        for viewset, url in [
+            (views.BatterStatViewSet, "/api/batter_stats/"),
+            (views.PitcherStatViewSet, "/api/pitcher_stats/"),
+            (views.FieldingStatViewSet, "/api/fielding_stats/"),
+        ]:
+            for query in ("", "?page_size=4", f"?player_id={self.players[1].pk}"):
+                with self.subTest(url=url + query):
+                    bump_ingest_generation()
+                    fast = self.client.get(url + query).content
+                    # a new generation, so the slow path renders instead of
+                    # being served the fast path's cached response
+                    bump_ingest_generation()
+                    viewset.fast_list = False
+                    try:
+                        with CaptureQueriesContext(connection) as queries:
+                            slow = self.client.get(url + query).content
+                    finally:
+                        viewset.fast_list = True
+                    self.assertGreater(len(queries), 0)
+                    self.assertEqual(fast, slow)
+
+
+class RunningLineTests(StatTestCase):
+    def test_running_batting_and_pitching_lines(self):
+        player = self.players[0]
+        for number in (1, 2):
+            game = self.add_game(number)
+            PitcherStat.objects.create(player_id=player, game_id=game, **PITCHER_LINE)
+        # saved row by row so the game snapshots follow
+        line = BatterStat.objects.get(player_id=player, game_id=game)
+        line.hits = line.double = 0
+        line.save()
+        line = PitcherStat.objects.get(game_id=game)
+        line.er, line.outs = 3, 0
+        line.save()
+
+        _, rows = self.count_queries(f"/api/batter_stats/?player_id={player.pk}")
+        self.assertEqual([row["cum_avg"] for row in rows], [2 / 4, 2 / 8])
+        self.assertEqual([row["cum_slg"] for row in rows], [3 / 4, 3 / 8])
+        self.assertEqual(rows[1]["cum_ops"], (2 + 2) / (8 + 2) + 3 / 8)
+        batting = rows[1]
+
+        _, rows = self.count_queries(f"/api/pitcher_stats/?player_id={player.pk}")
+        self.assertEqual([row["cum_era"] for row in rows], [27 / 9, 4 * 27 / 9])
+        self.assertEqual([row["cum_whip"] for row in rows], [4 / 3, 8 / 3])
+        pitching = rows[1]
+
+        # the running columns don't depend on which rows the query selects
+        for query in (f"game_id={game.pk}", f"player_id={player.pk}&game_date__gte=2025-03-02"):
+            with self.subTest(query=query):
+                _, rows = self.count_queries(f"/api/batter_stats/?{query}")
+                row = next(row for row in rows if row["player_id"] == player.pk)
+                for column in ("cum_avg", "cum_obp", "cum_slg", "cum_ops"):
+                    self.assertEqual(row[column], batting[column])
+                _, rows = self.count_queries(f"/api/pitcher_stats/?{query}")
+                self.assertEqual(
+                    (rows[0]["cum_era"], rows[0]["cum_whip"]),
+                    (pitching["cum_era"], pitching["cum_whip"]),
+                )
+
+
+class SideloadTests(StatTestCase):
+    def test_game_fields_are_sent_once_per_game(self):
+        for number in (1, 2):
+            self.add_game(number)
+        _, full = self.count_queries("/api/batter_stats/?page_size=10")
+        _, normalized = self.count_queries("/api/batter_stats/?page_size=10&sideload=games")
+        self.assertEqual(set(normalized["games"]), {"20251", "20252"})
+        for row, normalized_row in zip(full["results"], normalized["results"]):
+            game = normalized["games"][str(normalized_row["game_id"])]
+            self.assertNotIn("opponent_name", normalized_row)
+            self.assertEqual({**normalized_row, **game}, row)
+
+        _, unpaginated = self.count_queries(
+            f"/api/fielding_stats/?player_id={self.players[0].pk}&sideload=games"
+        )
+        self.assertEqual(
+            unpaginated["games"]["20251"]["opponent_name"], "Opponent"
+        )
+        self.assertEqual(len(unpaginated["results"]), 2)
+
+
+class IngestCacheTests(StatTestCase):
+    def test_aggregates_are_cached_until_the_next_ingest(self):
+        self.add_game(1)
+        game = self.add_game(2)
+        BatterStat.objects.get(player_id=self.players[0], game_id=game).delete()
+        bump_ingest_generation()
+        _, first = self.count_queries("/api/total_batting_stats/")
+        queries, second = self.count_queries("/api/total_batting_stats/")
+        self.assertEqual((queries, second), (0, first))
+
+        response = self.client.post(
+            "/api/batter_stats/create/",
+            {"player_id": self.players[0].pk, "game_id": game.pk, **BATTER_LINE},
+            content_type="application/json",
+            headers={"X-API-Key": settings.SCRAPER_API_KEY},
+        )
+        self.assertEqual(response.status_code, 201)
+        queries, third = self.count_queries("/api/total_batting_stats/")
+        self.assertGreater(queries, 0)
+        self.assertEqual(third[0]["total_ab"], first[0]["total_ab"] + 4)
+
+    def test_several_workers_need_a_shared_cache(self):
+        with override_settings(WEB_CONCURRENCY=4):
+            with self.assertRaises(ImproperlyConfigured):
+                check_cache_backend()
+            with override_settings(
+                CACHES={
+                    "default": {
+                        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                        "LOCATION": "/tmp/uva-stats-test-cache",
+                    }
+                }
+            ):
+                check_cache_backend()
+        check_cache_backend()
+
+
+class UpsertTests(StatTestCase):
+    def post(self, path, line):
+        return self.client.post(
+            f"/api/{path}/create/",
+            line,
+            content_type="application/json",
+            headers={"X-API-Key": settings.SCRAPER_API_KEY},
+        )
+
+    def test_reuploaded_lines_replace_the_stored_ones(self):
+        game = self.add_game(1)
+        player = self.players[0].pk
+        line = {"player_id": player, "game_id": game.pk, **BATTER_LINE, "ab": 6}
+        self.assertEqual(self.post("batter_stats", line).status_code, 200)
+        self.assertEqual(BatterStat.objects.filter(player_id=player).count(), 1)
+        self.assertEqual(
+            PlayerSeasonBatting.objects.get(player_id=player).totals()[:2], (1, 6)
+        )
+
+        # a second position in the same game is a line of its own
+        fielding = {"player_id": player, "game_id": game.pk, **FIELDING_LINE}
+        self.assertEqual(self.post("fielding_stats", {**fielding, "player_position": "2B"}).status_code, 201)
+        self.assertEqual(self.post("fielding_stats", {**fielding, "player_position": "2B"}).status_code, 200)
+        self.assertEqual(FieldingStat.objects.filter(player_id=player).count(), 2)
+
+        situational = {"player_id": player, "game_id": game.pk, "vs_lhp": {"succ_opp": "1-2"}}
+        self.assertEqual(self.post("situational_batting", situational).status_code, 201)
+        situational["vs_lhp"] = {"succ_opp": "2-3"}
+        self.assertEqual(self.post("situational_batting", situational).status_code, 200)
+        self.assertEqual(
+            list(SituationalSplit.objects.values_list("successes", "opportunities")), [(2, 3)]
+        )
+        call_command("rebuild_stats", verify=True, workers=1, stdout=StringIO())
+
+    def test_a_line_created_concurrently_is_updated(self):
+        game = self.add_game(1)
+        player = self.players[0].pk
+        first = QuerySet.first
+
+        def missed_once(queryset):
+            # the lookup runs before the other upload's row is committed
+            mock_first.side_effect = first
+            return None
+
+        line = {"player_id": player, "game_id": game.pk, **BATTER_LINE, "ab": 6}
+        with mock.patch.object(QuerySet, "first", autospec=True) as mock_first:
+            mock_first.side_effect = missed_once
+            self.assertEqual(self.post("batter_stats", line).status_code, 200)
+        self.assertEqual(
+            list(BatterStat.objects.filter(player_id=player).values_list("ab", flat=True)), [6]
+        )
+        call_command("rebuild_stats", verify=True, workers=1, stdout=StringIO())
+
+
+class IndexReportTests(StatTestCase):
+    def test_endpoints_read_the_stat_tables_through_indexes(self):
+        self.add_game(1)
+        self.add_game(2)
+        out = StringIO()
+        call_command("index_report", strict=True, stdout=out)
+        self.assertIn("batter_stats/?game_id=20252", out.getvalue())
+        self.assertIn("batterstat_game_player", out.getvalue())
+        self.assertIn("\npitcher_stats/ (HTTP 200", out.getvalue())
+
+    def test_listings_report_their_cursor_page(self):
+        for number in range(1, 4):
+            self.add_game(number)
+        out = StringIO()
+        with mock.patch.object(GameLogCursorPagination, "page_size", 2):
+            call_command("index_report", strict=True, stdout=out)
+        self.assertIn("\nbatter_stats/?cursor=", out.getvalue())
+
+    def test_endpoints_that_answer_without_reading_stats_fail(self):
+        self.add_game(1)
+        out = StringIO()
+        with override_settings(ALLOWED_HOSTS=["uvastats.example.com"]):
+            call_command("index_report", strict=True, stdout=out)
+            self.assertNotIn("HTTP 400", out.getvalue())
+
+            # a Host the settings reject gets a 400 before any query
+            with mock.patch(
+                "app.management.commands.index_report.client_host", return_value="elsewhere"
+            ):
+                with self.assertRaisesRegex(CommandError, "answered without reading one"):
+                    call_command("index_report", strict=True, stdout=StringIO())
+
+
+class CompressedCacheTests(StatTestCase):
+    def test_cached_responses_are_served_precompressed(self):
+        self.add_game(1)
+        plain = self.client.get("/api/total_batting_stats/")
+        self.assertNotIn("Content-Encoding", plain)
+
+        response = self.client.get(
+            "/api/total_batting_stats/", headers={"Accept-Encoding": "gzip;q=1.0"}
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertTrue(response["ETag"].startswith("W/"))
+        self.assertEqual(json.loads(gzip.decompress(response.content)), plain.json())
+
+        response = self.client.get(
+            "/api/total_batting_stats/", headers={"Accept-Encoding": "gzip;q=0"}
+        )
+        self.assertNotIn("Content-Encoding", response)
+
+
+class SingleFlightTests(StatTestCase):
+    def test_concurrent_misses_share_one_computation(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "rendered"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(single_flight("key", compute, 60))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual((len(calls), results), (1, ["rendered"] * 8))
+
+    def test_waits_on_another_workers_lock(self):
+        # another process holds the lock and fills the cache shortly after
+        cache.add("lock:key", True)
+        threading.Timer(0.1, cache.set, ("key", "theirs")).start()
+        self.assertEqual(single_flight("key", lambda: "ours", 60), "theirs")
+
+
+class SeasonBattingTests(StatTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_game(1, "2024-04-01")
+        self.add_game(2)
+        self.add_game(3)
+
+    def totals(self, url="/api/total_batting_stats/"):
+        bump_ingest_generation()
+        _, rows = self.count_queries(url)
+        return {row["player_id"]: (row["games"], row["total_ab"]) for row in rows}
+
+    def test_totals_follow_saves_and_deletes(self):
+        player = self.players[0].pk
+        self.assertEqual(
+            PlayerSeasonBatting.objects.filter(player_id=player).count(), 2
+        )
+        self.assertEqual(self.totals()[player], (3, 12))
+        self.assertEqual(self.totals("/api/total_batting_stats/?season=2025")[player], (2, 8))
+
+        stat = BatterStat.objects.filter(player_id=player).latest("id")
+        stat.ab = 6
+        stat.save()
+        self.assertEqual(self.totals()[player], (3, 14))
+
+        stat.delete()
+        self.assertEqual(self.totals()[player], (2, 8))
+        BatterStat.objects.filter(player_id=player, game_id__game_date__year=2024).get().delete()
+        self.assertFalse(
+            PlayerSeasonBatting.objects.filter(player_id=player, season=2024).exists()
+        )
+
+
+class FieldingByPositionTests(StatTestCase):
+    def test_one_row_per_position(self):
+        for number in (1, 2, 3):
+            self.add_game(number)
+        # the first player moves to 2B for the last game
+        stat = FieldingStat.objects.filter(player_id=self.players[0]).latest("id")
+        stat.player_position = "2B"
+        stat.po = 5
+        stat.save()
+
+        _, rows = self.count_queries("/api/total_fielding_stats_by_pos/")
+        splits = {
+            row["player_position"]: (row["games_at_position"], row["total_po"])
+            for row in rows
+            if row["player_id"] == self.players[0].pk
+        }
+        self.assertEqual(splits, {"SS": (2, 4), "2B": (1, 5)})
+        self.assertEqual(len(rows), 4)
+
+        _, rows = self.count_queries("/api/total_fielding_stats_by_pos/?player_position=2B")
+        self.assertEqual([row["player_id"] for row in rows], [self.players[0].pk])
+
+
+class StatsAsOfTests(StatTestCase):
+    def as_of(self, date, player=0):
+        _, line = self.count_queries(
+            f"/api/stats_as_of/?player_id={self.players[player].pk}&date={date}"
+        )
+        return line
+
+    def test_snapshots_follow_out_of_order_ingest(self):
+        self.add_game(1)
+        self.add_game(3)
+        # ingested last, played in between
+        self.add_game(2)
+
+        line = self.as_of("2025-03-02")
+        self.assertEqual((line["batting"]["games"], line["batting"]["ab"]), (2, 8))
+        self.assertEqual(line["batting"]["avg"], 0.5)
+        self.assertEqual(line["fielding"]["po"], 4)
+        self.assertIsNone(line["pitching"])
+        self.assertEqual(self.as_of("2025-06-01")["batting"]["ab"], 12)
+        self.assertIsNone(self.as_of("2024-12-31")["batting"])
+
+        BatterStat.objects.filter(player_id=self.players[0], game_id=20251).get().delete()
+        bump_ingest_generation()
+        self.assertEqual(self.as_of("2025-03-02")["batting"]["ab"], 4)
+        call_command("rebuild_stats", verify=True, workers=1, stdout=StringIO())
+
+    def test_range_totals_are_snapshot_differences(self):
+        self.add_game(1, "2024-04-01")
+        for number in (2, 3, 4):
+            self.add_game(number)
+        PitcherStat.objects.create(
+            player_id=self.players[0], game_id=GameInfo.objects.get(pk=20253), **PITCHER_LINE
+        )
+        player = self.players[0].pk
+
+        def totals(url):
+            _, rows = self.count_queries(url)
+            return {row["player_id"]: row for row in rows}
+
+        # across seasons: the 2024 game and the first two 2025 games
+        batting = totals("/api/total_batting_stats/?start=2024-03-01&end=2025-03-03")
+        self.assertEqual((batting[player]["games"], batting[player]["total_ab"]), (3, 12))
+        self.assertEqual(batting[player]["total_team_games"], 3)
+        batting = totals("/api/total_batting_stats/?start=2025-03-03")
+        self.assertEqual((batting[player]["games"], batting[player]["avg"]), (2, 0.5))
+        self.assertEqual(totals("/api/total_batting_stats/?end=2024-01-01"), {})
+
+        pitching = totals("/api/total_pitching_stats/?start=2025-03-03&end=2025-03-03")
+        self.assertEqual(list(pitching), [player])
+        self.assertEqual(totals("/api/total_pitching_stats/?start=2025-03-04"), {})
+        fielding = totals("/api/total_fielding_stats_by_player/?start=2025-03-02&end=2025-03-02")
+        self.assertEqual(fielding[player]["total_po"], 2)
+        # the per-player counts cover the range too
+        self.assertEqual(
+            (
+                fielding[player]["total_team_games"],
+                fielding[player]["total_player_games"],
+                fielding[player]["total_pa"],
+            ),
+            (1, 1, 5),
+        )
+
+        # a range over every season counts the same games as no range,
+        # pitching left out of both
+        FieldingStat.objects.create(
+            player_id=self.players[0], game_id=GameInfo.objects.get(pk=20253),
+            player_position="P", **FIELDING_LINE
+        )
+        bump_ingest_generation()
+        unfiltered = totals("/api/total_fielding_stats_by_player/")
+        seasons = totals("/api/total_fielding_stats_by_player/?start=2024-01-01&end=2025-12-31")
+        self.assertEqual(
+            (unfiltered[player]["total_player_games"], seasons[player]["total_player_games"]),
+            (4, 4),
+        )
+        response = self.client.get("/api/total_batting_stats/?end=2025-03")
+        self.assertEqual(response.status_code, 400)
+
+    def test_lines_are_cached_until_the_next_ingest(self):
+        self.add_game(1)
+        url = f"/api/stats_as_of/?player_id={self.players[0].pk}&date=2025-03-01"
+        response = self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get(url)
+            revalidated = self.client.get(url, headers={"If-None-Match": response["ETag"]})
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(cached.json(), response.json())
+        self.assertEqual(revalidated.status_code, 304)
+
+        self.add_game(2)
+        bump_ingest_generation()
+        self.assertEqual(self.as_of("2025-03-02")["batting"]["games"], 2)
+        response = self.client.get(url, headers={"If-None-Match": response["ETag"]})
+        self.assertEqual(response.status_code, 200)
+
+    def test_requires_player_and_date(self):
+        response = self.client.get("/api/stats_as_of/?player_id=1&date=2025-02-30")
+        self.assertEqual(response.status_code, 400)
+
+
+class GameDateFilterTests(StatTestCase):
+    def test_game_linked_endpoints_filter_on_game_date(self):
+        for number, date in ((1, "2024-04-01"), (2, "2025-03-02"), (3, "2025-03-09")):
+            game = self.add_game(number, date)
+            BattingSituational.objects.create(player_id=self.players[0], game_id=game)
+
+        def games(path, query):
+            _, page = self.count_queries(f"/api/{path}/?{query}")
+            return sorted({row["game_id"] for row in page["results"]})
+
+        for path in ("batter_stats", "fielding_stats", "batter_situational_stats", "game_info"):
+            self.assertEqual(games(path, "game_date__gte=2025-01-01"), [20252, 20253])
+            self.assertEqual(
+                games(path, "game_date__gte=2024-04-01&game_date__lte=2025-03-02"),
+                [20251, 20252],
+            )
+
+
+class SituationalSplitTests(StatTestCase):
+    def test_ingest_writes_typed_splits(self):
+        game = self.add_game(1)
+        response = self.client.post(
+            "/api/situational_batting/create/",
+            {
+                "player_id": self.players[0].pk,
+                "game_id": game.pk,
+                "with_runners": {"succ_opp": "3-7", "AB": 7, "H": 3, "RBI": 2},
+                "vs_lhp": {"succ_opp": "0-1", "AB": 1, "K": 1},
+            },
+            content_type="application/json",
+            headers={"X-API-Key": settings.SCRAPER_API_KEY},
+        )
+        self.assertEqual(response.status_code, 201)
+        splits = {
+            split.situation: (split.successes, split.opportunities, split.ab, split.h, split.rbi, split.k)
+            for split in SituationalSplit.objects.filter(player_id=self.players[0])
+        }
+        self.assertEqual(
+            splits, {"with_runners": (3, 7, 7, 3, 2, 0), "vs_lhp": (0, 1, 1, 0, 0, 1)}
+        )
+
+        situational = BattingSituational.objects.get()
+        situational.vs_lhp = {}
+        situational.save()
+        self.assertEqual(
+            list(SituationalSplit.objects.values_list("situation", flat=True)), ["with_runners"]
+        )
+        game.delete()
+        self.assertFalse(SituationalSplit.objects.exists())
+
+
+class SituationalSplitsEndpointTests(StatTestCase):
+    def setUp(self):
+        super().setUp()
+        for number, date, succ_opp in ((1, "2024-04-01", "1-2"), (2, None, "3-7"), (3, None, "0-1")):
+            game = self.add_game(number, date)
+            for player in self.players[:2]:
+                BattingSituational.objects.create(
+                    player_id=player,
+                    game_id=game,
+                    hits_with_risp={"succ_opp": succ_opp, "AB": 4, "H": 1},
+                    bases_loaded={"succ_opp": "1-1", "AB": 1, "H": 1, "RBI": 2},
+                )
+
+    def splits(self, query):
+        queries, rows = self.count_queries(f"/api/situational_splits/?{query}")
+        self.assertEqual(queries, 1)
+        return {
+            (row.get("player_id"), row["situation"]): (
+                row["games"], row["successes"], row["opportunities"], row["pct"], row["rbi"]
+            )
+            for row in rows
+        }
+
+    def test_grouped_per_player_and_situation(self):
+        player = self.players[0].pk
+        self.assertEqual(
+            self.splits(f"player_id={player}&season=2025"),
+            {
+                (player, "hits_with_risp"): (2, 3, 8, 3 / 8, 0),
+                (player, "bases_loaded"): (2, 2, 2, 1.0, 4),
+            },
+        )
+        self.assertEqual(
+            self.splits(f"player_id={player}&start=2024-01-01&end=2024-12-31")[
+                (player, "hits_with_risp")
+            ],
+            (1, 1, 2, 0.5, 0),
+        )
+        self.assertEqual(len(self.splits("")), 4)
+
+    def test_team_totals(self):
+        self.assertEqual(
+            self.splits("by=team&situation=hits_with_risp"),
+            {(None, "hits_with_risp"): (3, 8, 20, 0.4, 0)},
+        )
+
+
+class RebuildStatsTests(StatTestCase):
+    def test_verify_and_rebuild(self):
+        game = self.add_game(1)
+        PitcherStat.objects.create(player_id=self.players[0], game_id=game, **PITCHER_LINE)
+        out = StringIO()
+        # the test database is in memory: diff in this process
+        call_command("rebuild_stats", verify=True, workers=1, stdout=out)
+        self.assertIn("PlayerSeasonPitching: 1 rows match", out.getvalue())
+
+        # bypasses PitcherStat.save()
+        PitcherStat.objects.update(outs=27)
+        with self.assertRaises(CommandError):
+            call_command("rebuild_stats", verify=True, workers=1, stdout=out, stderr=StringIO())
+
+        call_command("rebuild_stats", workers=1, stdout=out, stderr=StringIO())
+        call_command("rebuild_stats", verify=True, workers=1, stdout=out)
+        _, rows = self.count_queries("/api/total_pitching_stats/")
+        self.assertEqual((rows[0]["total_outs"], rows[0]["total_games"]), (27, 1))
+
+    def test_rebuilds_only_the_differing_rows(self):
+        for number, date in ((1, "2024-04-01"), (2, None)):
+            game = self.add_game(number, date)
+            BattingSituational.objects.create(
+                player_id=self.players[0], game_id=game, vs_lhp={"succ_opp": "1-2", "AB": 2}
+            )
+        untouched = set(SituationalSplit.objects.values_list("pk", flat=True))
+        SituationalSplit.objects.filter(game_id__game_date__year=2025).delete()
+        PlayerSeasonBatting.objects.filter(season=2024).update(ab=0)
+
+        out = StringIO()
+        # a season that wasn't asked for is left alone
+        call_command("rebuild_stats", season=[2024], workers=1, stdout=out, stderr=StringIO())
+        self.assertEqual(SituationalSplit.objects.count(), 1)
+        self.assertEqual(
+            set(PlayerSeasonBatting.objects.values_list("season", "ab")),
+            {(2024, BATTER_LINE["ab"]), (2025, BATTER_LINE["ab"])},
+        )
+
+        call_command("rebuild_stats", workers=1, stdout=out, stderr=StringIO())
+        self.assertIn("SituationalSplit: replaced 0 of 2 rows with 1", out.getvalue())
+        self.assertTrue(untouched & set(SituationalSplit.objects.values_list("pk", flat=True)))
+        call_command("rebuild_stats", verify=True, workers=1, stdout=out)
+
+    def test_a_game_ingested_during_the_diff_is_kept(self):
+        game = self.add_game(1)
+        PitcherStat.objects.create(player_id=self.players[0], game_id=game, **PITCHER_LINE)
+        # bypasses PitcherStat.save()
+        PitcherStat.objects.update(outs=27)
+
+        def ingest(tables):
+            # lands after the first diff, before the swap's lock
+            PitcherStat.objects.create(
+                player_id=self.players[0], game_id=self.add_game(2), **PITCHER_LINE
+            )
+
+        with mock.patch(
+            "app.management.commands.rebuild_stats.lock_tables", side_effect=ingest
+        ):
+            call_command("rebuild_stats", workers=1, stdout=StringIO(), stderr=StringIO())
+        call_command("rebuild_stats", verify=True, workers=1, stdout=StringIO())
+        self.assertEqual(
+            PlayerSeasonPitching.objects.get(player_id=self.players[0]).games, 2
+        )
+
+
+class WarmCacheTests(StatTestCase):
+    def test_warmed_endpoints_are_served_from_the_cache(self):
+        self.add_game(1)
+        # one worker renders inline, on the test's connection
+        results, _ = warm(warm_paths(), client_fetcher(), workers=1)
+        self.assertEqual([status for _, status, _ in results], [200] * 16)
+
+        for url in (
+            "/api/total_pitching_stats/",
+            f"/api/batter_stats/?player_id={self.players[2].pk}",
+            f"/api/situational_splits/?player_id={self.players[0].pk}",
+        ):
+            queries, _ = self.count_queries(url)
+            self.assertEqual(queries, 0, url)
+
+    def test_an_unreachable_server_is_reported(self):
+        self.add_game(1)
+        # nothing listens on port 1
+        results, _ = warm(["total_batting_stats/"], http_fetcher("http://127.0.0.1:1/api/"))
+        self.assertEqual(results[0][1], "ConnectionError")
+        with self.assertRaisesRegex(CommandError, "No endpoint warmed"):
+            call_command(
+                "warm_cache", base_url="http://127.0.0.1:1/api/", stdout=StringIO(),
+                stderr=StringIO(),
+            )
+
+
+class ConditionalGetTests(StatTestCase):
+    def test_matching_etag_skips_the_queryset(self):
+        self.add_game(1)
+        url = f"/api/batter_stats/?player_id={self.players[0].pk}"
+        response = self.client.get(url)
+        etag = response["ETag"]
+        self.assertFalse(response.has_header("Last-Modified"))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual((response.status_code, len(queries)), (304, 0))
+        # a one-second date can't tell generations apart
+        response = self.client.get(
+            url, headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        other = self.client.get(f"/api/batter_stats/?player_id={self.players[1].pk}")
+        self.assertNotEqual(other["ETag"], etag)
+
+        bump_ingest_generation()
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
@@ -7,8 +7,17 @@ from .models import (
     GameInfo,
     BattingSituational,
     SchoolInfo,
+    PlayerSeasonBatting,
+    PlayerSeasonPitching,
+    PlayerSeasonFielding,
+    PlayerGameBatting,
+    PlayerGamePitching,
+    PlayerGameFielding,
+    SituationalSplit,
 )
 from .serializers import (
+    BATTING_RUNNING_TOTALS,
+    PITCHING_RUNNING_TOTALS,
     BatterStatSerializer,
     PitcherStatSerializer,
     PlayerInfoSerializer,
@@ -20,28 +29,138 @@ from .serializers import (
     FieldingStatSumByPlayerSerializer,
     BatterSituationalSerializer,
     SchoolInfoSerializer,
+    PlayerGameBattingSerializer,
+    PlayerGamePitchingSerializer,
+    PlayerGameFieldingSerializer,
+    SituationalSplitSumSerializer,
+    StatSummaryContext,
+)
+
+
+from .pagination import GameLogCursorPagination
+from .fast_serializers import FastListMixin
+from .caching import ConditionalGetMixin, IngestCachedMixin, bump_ingest_generation
+from .filters import (
+    BatterSituationalFilter,
+    BatterStatFilter,
+    FieldingStatFilter,
+    GameInfoFilter,
+    NullsLastOrderingFilter,
+    PitcherStatFilter,
+    TeamBattingStatsFilter,
+    TeamPitchingStatsFilter,
+    SituationalSplitFilter,
 )
 
 
 from rest_framework import viewsets, status
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
+from rest_framework.pagination import LimitOffsetPagination
 from django.conf import settings
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Cast, Coalesce, NullIf
+from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+import datetime
 
 # Create your views here.
 
 
-class BatterStatViewSet(viewsets.ReadOnlyModelViewSet):
+# Relations the game-log serializers read on every row (player_name,
+# opponent, selected_team, box_score_link, ...), joined up front
+GAME_LOG_RELATIONS = ("player_id", "game_id__opponent", "game_id__selected_team")
+
+
+def running_total(expression):
+    """A season-to-date total through the row's game, read from the
+    PlayerGame* snapshot joined as `snapshot` (see
+    GameSnapshot.source_relation), so filters and pages can't change it.
+    0 if the row has no snapshot (no player or game).
+    """
+    return Coalesce(expression, 0)
+
+
+def rate(numerator, denominator):
+    """`numerator / denominator` as a float, NULL when the denominator is 0."""
+    return Cast(numerator, models.FloatField()) / NullIf(
+        Cast(denominator, models.FloatField()), 0.0
+    )
+
+
+def requested_date_range(request):
+    """(start, end) from ?start=/?end= (YYYY-MM-DD, either may be left
+    open), or None without either."""
+    bounds = []
+    for param, default in (("start", datetime.date.min), ("end", datetime.date.max)):
+        value = request.query_params.get(param)
+        try:
+            bound = parse_date(value) if value else default
+        except ValueError:
+            bound = None
+        if bound is None:
+            raise ValidationError({param: "Enter a date as YYYY-MM-DD."})
+        bounds.append(bound)
+    if "start" not in request.query_params and "end" not in request.query_params:
+        return None
+    return tuple(bounds)
+
+
+class DateRangeSummaryMixin:
+    """Gives the summary serializers a StatSummaryContext for the
+    ?start=/?end= range the totals cover (see season_totals)."""
+
+    def get_serializer_context(self):
+        return {
+            **super().get_serializer_context(),
+            "summary": StatSummaryContext(requested_date_range(self.request)),
+        }
+
+
+def season_totals(request, rows, snapshot_model, totals):
+    """The season-totals `rows` to group by player and the sums to annotate
+    for `totals` ({name: column}).
+
+    With ?start=/?end=, each player's totals are instead, season by season,
+    their snapshot as of `end` minus their snapshot from before `start`
+    (GameSnapshot.between): two indexed lookups per player-season, however
+    many columns and games the range holds.
+    """
+    date_range = requested_date_range(request)
+    if date_range is None:
+        return rows, {name: models.Sum(column) for name, column in totals.items()}
+
+    return snapshot_model.between(rows, *date_range), {
+        name: models.Sum(snapshot_model.change(column)) for name, column in totals.items()
+    }
+
+
+class BatterStatViewSet(
+    ConditionalGetMixin,
+    IngestCachedMixin,
+    FastListMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = BatterStatSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = "__all__"
+    filterset_class = BatterStatFilter
+    related_fields = GAME_LOG_RELATIONS
+    pagination_class = GameLogCursorPagination
 
     def get_queryset(self):
-        return BatterStat.objects.annotate(
+        fielding_position = FieldingStat.objects.filter(
+            player_id=models.OuterRef("player_id"), game_id=models.OuterRef("game_id")
+        ).order_by("id")
+        return BatterStat.objects.select_related(*self.related_fields).annotate(
+            snapshot=PlayerGameBatting.source_relation()
+        ).annotate(
+            fielding_position=models.Subquery(
+                fielding_position.values("player_position")[:1]
+            ),
             pa=(
                 models.F("ab")
                 + models.F("bb")
@@ -49,45 +168,103 @@ class BatterStatViewSet(viewsets.ReadOnlyModelViewSet):
                 + models.F("sf")
                 + models.F("sh")
                 + models.F("ibb")
-            )
+            ),
+            **{
+                name: running_total(expression)
+                for name, expression in BATTING_RUNNING_TOTALS.items()
+            },
         ).filter(pa__gt=0)
 
 
-class BatterSituationalViewSet(viewsets.ReadOnlyModelViewSet):
+class BatterSituationalViewSet(
+    ConditionalGetMixin, IngestCachedMixin, viewsets.ReadOnlyModelViewSet
+):
     serializer_class = BatterSituationalSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = "game_id", "player_id"
-    queryset = BattingSituational.objects.order_by("id")
+    filterset_class = BatterSituationalFilter
+    related_fields = ("player_id", "game_id__selected_team")
+    pagination_class = GameLogCursorPagination
+
+    def get_queryset(self):
+        return BattingSituational.objects.select_related(
+            *self.related_fields
+        ).order_by("id")
 
 
-class PitcherStatViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = PitcherStat.objects.order_by("game_id", "player_id")
+class PitcherStatViewSet(
+    ConditionalGetMixin,
+    IngestCachedMixin,
+    FastListMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = PitcherStatSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = "__all__"
+    filterset_class = PitcherStatFilter
+    related_fields = GAME_LOG_RELATIONS
+    pagination_class = GameLogCursorPagination
 
+    def get_queryset(self):
+        return (
+            PitcherStat.objects.select_related(*self.related_fields)
+            .order_by("game_id", "player_id")
+            .annotate(snapshot=PlayerGamePitching.source_relation())
+            .annotate(
+                cum_wins=running_total(models.F("snapshot__win")),
+                cum_losses=running_total(models.F("snapshot__loss")),
+                cum_saves=running_total(models.F("snapshot__sv")),
+                **{
+                    name: running_total(expression)
+                    for name, expression in PITCHING_RUNNING_TOTALS.items()
+                },
+            )
+        )
 
-class FieldingStatViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = FieldingStat.objects.order_by("game_id", "player_id").filter(
-        ~models.Q(player_position="P")
-    )
+
+class FieldingStatViewSet(
+    ConditionalGetMixin,
+    IngestCachedMixin,
+    FastListMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = FieldingStatSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = "__all__"
+    filterset_class = FieldingStatFilter
+    related_fields = GAME_LOG_RELATIONS
+    pagination_class = GameLogCursorPagination
+
+    def get_queryset(self):
+        return (
+            FieldingStat.objects.select_related(*self.related_fields)
+            .order_by("game_id", "player_id")
+            .filter(~models.Q(player_position="P"))
+            .annotate(snapshot=PlayerGameFielding.source_relation())
+            .annotate(
+                cum_fielded=running_total(
+                    models.F("snapshot__po") + models.F("snapshot__a")
+                ),
+                cum_chances=running_total(
+                    models.F("snapshot__po")
+                    + models.F("snapshot__a")
+                    + models.F("snapshot__e")
+                ),
+            )
+        )
 
 
-class GameInfoViewSet(viewsets.ReadOnlyModelViewSet):
+class GameInfoViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = GameInfo.objects.order_by("game_id")
     serializer_class = GameInfoSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = "__all__"
+    filterset_class = GameInfoFilter
+    pagination_class = GameLogCursorPagination
+    cursor_ordering = ("game_id",)
 
 
-class PlayerInfoViewSet(viewsets.ReadOnlyModelViewSet):
+class PlayerInfoViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = PlayerInfo.objects.all()
     serializer_class = PlayerInfoSerializer
     permission_classes = [AllowAny]
@@ -95,7 +272,7 @@ class PlayerInfoViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_fields = ["player_id", "player_name", "jersey_number", "height", "weight"]
 
 
-class SchoolInfoViewSet(viewsets.ReadOnlyModelViewSet):
+class SchoolInfoViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = SchoolInfo.objects.all()
     permission_classes = [AllowAny]
     serializer_class = SchoolInfoSerializer
@@ -103,6 +280,35 @@ class SchoolInfoViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_fields = "__all__"
 
 
+def upsert(serializer, key):
+    """Save a validated serializer over the stored row with the same `key`
+    fields, if there is one, and return whether a row was created.
+
+    Updating goes through the model's save(), which takes the stored row
+    back out of the season and snapshot tables before adding the new one;
+    an ON CONFLICT upsert would skip that. A stored row is locked while it
+    is replaced. When there is none yet, two uploads of the same line can
+    both try to create it: the loser's insert hits the unique constraint,
+    is rolled back to a savepoint, and updates the winner's row instead.
+    """
+    model = serializer.Meta.model
+    lookup = {field: serializer.validated_data.get(field) for field in key}
+    with transaction.atomic():
+        if None not in lookup.values():
+            serializer.instance = model.objects.select_for_update().filter(**lookup).first()
+        if serializer.instance is None:
+            try:
+                with transaction.atomic():
+                    serializer.save()
+                return True
+            except IntegrityError:
+                if None in lookup.values():
+                    raise
+                serializer.instance = model.objects.select_for_update().get(**lookup)
+        serializer.save()
+    return False
+
+
 class BatterStatCreateView(APIView):
     permission_classes = [AllowAny]
 
@@ -116,8 +322,13 @@ class BatterStatCreateView(APIView):
             )
         serializer = BatterStatSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            # re-uploading a game replaces its lines
+            created = upsert(serializer, ("player_id", "game_id"))
+            bump_ingest_generation()
+            return Response(
+                serializer.data,
+                status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+            )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -133,8 +344,13 @@ class BatterSituationalCreateView(APIView):
             )
         serializer = BatterSituationalSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            # re-uploading a game replaces its lines
+            created = upsert(serializer, ("player_id", "game_id"))
+            bump_ingest_generation()
+            return Response(
+                serializer.data,
+                status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+            )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -152,8 +368,13 @@ class PitcherStatCreateView(APIView):
             )
         serializer = PitcherStatSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            # re-uploading a game replaces its lines
+            created = upsert(serializer, ("player_id", "game_id"))
+            bump_ingest_generation()
+            return Response(
+                serializer.data,
+                status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+            )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -169,8 +390,13 @@ class FieldingStatCreateView(APIView):
             )
         serializer = FieldingStatSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            # re-uploading a game replaces its lines
+            created = upsert(serializer, ("player_id", "game_id", "player_position"))
+            bump_ingest_generation()
+            return Response(
+                serializer.data,
+                status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+            )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -187,124 +413,184 @@ class GameInfoCreateView(APIView):
         serializer = GameInfoSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save()
+            bump_ingest_generation()
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class TeamBattingStatsViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamBattingStatsViewSet(
+    ConditionalGetMixin,
+    IngestCachedMixin,
+    DateRangeSummaryMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     permission_classes = [AllowAny]
     serializer_class = BatterStatSumSerializer
-    filter_backends = [DjangoFilterBackend]
-    filterset_fields = "__all__"
+    filter_backends = [DjangoFilterBackend, NullsLastOrderingFilter]
+    filterset_class = TeamBattingStatsFilter
+    ordering_fields = [
+        "avg", "obp", "slg", "ops", "tb", "total_pa", "total_ab", "total_hits",
+        "total_hr", "total_rbi", "total_runs", "total_bb", "total_strikeouts",
+        "total_sb", "player_id__jersey_number", "player_id__player_name",
+    ]
+    # unpaginated unless ?limit= is given, e.g. ?ordering=-ops&limit=10
+    pagination_class = LimitOffsetPagination
+    totals = {
+        "total_games": "games",
+        "total_hits": "hits",
+        "total_ab": "ab",
+        "total_runs": "runs",
+        "total_rbi": "rbi",
+        "total_bb": "bb",
+        "total_ibb": "ibb",
+        "total_hbp": "hbp",
+        "total_sb": "sb",
+        "total_cs": "cs",
+        "total_dp": "dp",
+        "total_double": "double",
+        "total_triple": "triple",
+        "total_sf": "sf",
+        "total_sh": "sh",
+        "total_picked_off": "picked_off",
+        "total_hr": "hr",
+        "total_strikeouts": "so",
+    }
 
     def get_queryset(self):
+        # one row per player-season-team instead of every game line; filter
+        # with e.g. ?season=2025 or ?team=746 before the totals are summed,
+        # or ask for a date range with ?start=2025-03-01&end=2025-03-31
+        rows, totals = season_totals(
+            self.request, PlayerSeasonBatting.objects.all(), PlayerGameBatting, self.totals
+        )
         return (
-            BatterStat.objects.values(
+            rows.values(
                 "player_id", "player_id__player_name", "player_id__jersey_number"
             )
+            .annotate(**totals, id=models.F("player_id"))
             .annotate(
-                total_hits=models.Sum("hits"),
-                total_ab=models.Sum("ab"),
-                total_runs=models.Sum("runs"),
-                total_rbi=models.Sum("rbi"),
-                total_bb=models.Sum("bb"),
-                total_ibb=models.Sum("ibb"),
-                total_hbp=models.Sum("hbp"),
-                total_sb=models.Sum("sb"),
-                total_cs=models.Sum("cs"),
-                total_dp=models.Sum("dp"),
-                total_double=models.Sum("double"),
-                total_triple=models.Sum("triple"),
-                total_sf=models.Sum("sf"),
-                total_sh=models.Sum("sh"),
-                total_picked_off=models.Sum("picked_off"),
-                total_hr=models.Sum("hr"),
-                total_strikeouts=models.Sum("so"),
-                total_pa=models.Sum(
-                    models.F("ab")
-                    + models.F("bb")
-                    + models.F("hbp")
-                    + models.F("sf")
-                    + models.F("sh")
-                    + models.F("ibb")
+                total_pa=(
+                    models.F("total_ab")
+                    + models.F("total_bb")
+                    + models.F("total_hbp")
+                    + models.F("total_sf")
+                    + models.F("total_sh")
+                    + models.F("total_ibb")
+                ),
+                tb=(
+                    models.F("total_hits")
+                    + models.F("total_double")
+                    + models.F("total_triple") * 2
+                    + models.F("total_hr") * 3
                 ),
-                id=models.F("player_id"),
+            )
+            .annotate(
+                avg=rate(models.F("total_hits"), models.F("total_ab")),
+                obp=rate(
+                    models.F("total_hits")
+                    + models.F("total_bb")
+                    + models.F("total_hbp")
+                    + models.F("total_ibb"),
+                    models.F("total_ab")
+                    + models.F("total_hbp")
+                    + models.F("total_ibb")
+                    + models.F("total_bb")
+                    + models.F("total_sf"),
+                ),
+                slg=rate(models.F("tb"), models.F("total_ab")),
+            )
+            .annotate(
+                ops=NullIf(models.F("obp"), 0.0) + NullIf(models.F("slg"), 0.0),
             )
             .filter(total_pa__gt=0)
         )
 
 
-class TeamPitchingStatsViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamPitchingStatsViewSet(
+    ConditionalGetMixin,
+    IngestCachedMixin,
+    DateRangeSummaryMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     permission_classes = [AllowAny]
     serializer_class = PitcherStatSumSerializer
-    filter_backends = [DjangoFilterBackend]
-    filterset_fields = "__all__"
+    filter_backends = [DjangoFilterBackend, NullsLastOrderingFilter]
+    filterset_class = TeamPitchingStatsFilter
+    ordering_fields = [
+        "total_era", "total_whip", "total_outs", "total_so", "total_bb",
+        "total_h", "total_er", "total_wins", "total_losses", "total_saves",
+        "total_games", "total_starts", "player_id__jersey_number",
+        "player_id__player_name",
+    ]
+    # unpaginated unless ?limit= is given, e.g. ?ordering=total_era&limit=10
+    pagination_class = LimitOffsetPagination
+
+    totals = {
+        "total_h": "h",
+        "total_r": "r",
+        "total_er": "er",
+        "total_outs": "outs",
+        "total_bb": "bb",
+        "total_so": "so",
+        "total_bf": "bf",
+        "total_doubles_allowed": "doubles_allowed",
+        "total_triples_allowed": "triples_allowed",
+        "total_hr_allowed": "hr_allowed",
+        "total_wp": "wp",
+        "total_hb": "hb",
+        "total_starts": "starter",
+        "total_ibb": "ibb",
+        "total_balk": "balk",
+        "total_ir": "ir",
+        "total_irs": "irs",
+        "total_sh_allowed": "sh_allowed",
+        "total_sf_allowed": "sf_allowed",
+        "total_kl": "kl",
+        "total_pickoffs": "pickoffs",
+        "total_wins": "win",
+        "total_losses": "loss",
+        "total_saves": "sv",
+        "total_games": "games",
+    }
 
     def get_queryset(self):
-        return PitcherStat.objects.values(
-            "player_id", "player_id__player_name", "player_id__jersey_number"
-        ).annotate(
-            total_h=models.Sum("h"),
-            total_r=models.Sum("r"),
-            total_er=models.Sum("er"),
-            total_outs=models.Sum("outs"),
-            total_bb=models.Sum("bb"),
-            total_so=models.Sum("so"),
-            total_bf=models.Sum("bf"),
-            total_doubles_allowed=models.Sum("doubles_allowed"),
-            total_triples_allowed=models.Sum("triples_allowed"),
-            total_hr_allowed=models.Sum("hr_allowed"),
-            total_wp=models.Sum("wp"),
-            total_hb=models.Sum("hb"),
-            total_starts=models.Sum("starter"),
-            #     models.Case(
-            #         models.When(starter=True, then=1),
-            #         default=0,
-            #         output_field=models.IntegerField()
-            #     )
-            # ),
-            total_ibb=models.Sum("ibb"),
-            total_balk=models.Sum("balk"),
-            total_ir=models.Sum("ir"),
-            total_irs=models.Sum("irs"),
-            total_sh_allowed=models.Sum("sh_allowed"),
-            total_sf_allowed=models.Sum("sf_allowed"),
-            total_kl=models.Sum("kl"),
-            total_pickoffs=models.Sum("pickoffs"),
-            total_wins=models.Sum("win"),
-            #     models.Case(
-            #         models.When(win=True, then=1),
-            #         default=0,
-            #         output_field=models.IntegerField()
-            #     )
-            # ),
-            total_losses=models.Sum("loss"),
-            #     models.Case(
-            #         models.When(loss=True, then=1),
-            #         default=0,
-            #         output_field=models.IntegerField()
-            #     )
-            # ),
-            total_saves=models.Sum("sv"),
-            #     models.Case(
-            #         models.When(sv=True, then=1),
-            #         default=0,
-            #         output_field=models.IntegerField()
-            #     )
-            # ),
-            total_games=models.Count("game_id"),
+        # one row per player-season-team, like TeamBattingStatsViewSet
+        # (including ?start=/?end=)
+        rows, totals = season_totals(
+            self.request, PlayerSeasonPitching.objects.all(), PlayerGamePitching, self.totals
+        )
+        return (
+            rows.values(
+                "player_id", "player_id__player_name", "player_id__jersey_number"
+            )
+            .annotate(**totals)
+            .annotate(
+                total_era=rate(models.F("total_er") * 27, models.F("total_outs")),
+                total_whip=rate(
+                    models.F("total_bb") + models.F("total_ibb") + models.F("total_h"),
+                    Cast(models.F("total_outs"), models.FloatField()) / 3,
+                ),
+            )
+            # players without an appearance in a requested date range
+            .filter(total_games__gt=0)
         )
 
 
-class TeamFieldingStatsByPosViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamFieldingStatsByPosViewSet(
+    ConditionalGetMixin, IngestCachedMixin, viewsets.ReadOnlyModelViewSet
+):
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = "__all__"
     serializer_class = FieldingStatSumByPosSerializer
 
     def get_queryset(self):
-        return FieldingStat.objects.values(
-            "player_id", "player_id__player_name", "player_id__jersey_number"
+        # one row per player and position, summed over their season rows
+        return PlayerSeasonFielding.objects.values(
+            "player_id",
+            "player_id__player_name",
+            "player_id__jersey_number",
+            "player_position",
         ).annotate(
             total_po=models.Sum("po"),
             total_a=models.Sum("a"),
@@ -314,49 +600,131 @@ class TeamFieldingStatsByPosViewSet(viewsets.ReadOnlyModelViewSet):
             total_cs=models.Sum("cs"),
             total_dp=models.Sum("dp"),
             total_tp=models.Sum("tp"),
-            total_games=models.Count("game_id"),
             total_catchers_interference=models.Sum("catchers_interference"),
-            all_positions=models.F("player_position"),
-            games_at_position=models.Count(
-                models.Case(
-                    models.When(player_position=models.F("all_positions"), then=1),
-                    default=0,
-                    output_field=models.IntegerField(),
-                )
-            ),
+            games_at_position=models.Sum("games"),
         )
 
 
-class TeamFieldingStatsByPlayerViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamFieldingStatsByPlayerViewSet(
+    ConditionalGetMixin,
+    IngestCachedMixin,
+    DateRangeSummaryMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = "__all__"
     serializer_class = FieldingStatSumByPlayerSerializer
+    totals = {
+        "total_po": "po",
+        "total_a": "a",
+        "total_e": "e",
+        "total_pb": "pb",
+        "total_sba": "sba",
+        "total_cs": "cs",
+        "total_dp": "dp",
+        "total_tp": "tp",
+        "total_games": "games",
+        "total_catchers_interference": "catchers_interference",
+    }
 
     def get_queryset(self):
+        # ?start=/?end= as for TeamBattingStatsViewSet; PlayerGameFielding
+        # leaves out pitching too
+        rows, totals = season_totals(
+            self.request,
+            PlayerSeasonFielding.objects.filter(~models.Q(player_position__exact="P")),
+            PlayerGameFielding,
+            self.totals,
+        )
         return (
-            FieldingStat.objects.values(
+            rows.values(
                 "player_id", "player_id__player_name", "player_id__jersey_number"
             )
+            .annotate(**totals)
+            .filter(
+                models.Q(total_po__gt=0) | models.Q(total_e__gt=0) | models.Q(total_e__gt=0),
+            )
+        )
+
+
+class SituationalSplitsViewSet(
+    ConditionalGetMixin, IngestCachedMixin, viewsets.ReadOnlyModelViewSet
+):
+    # Situational totals per player and situation in one GROUP BY, e.g.
+    # ?player_id=12&season=2025 or ?start=2025-03-01&end=2025-03-31;
+    # ?by=team sums every player into one row per situation
+    permission_classes = [AllowAny]
+    serializer_class = SituationalSplitSumSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = SituationalSplitFilter
+    totals = (
+        "successes", "opportunities", "ab", "h", "r", "rbi", "bb", "k", "go", "fo",
+        "hbp", "sf", "double", "triple", "hr",
+    )
+
+    def get_queryset(self):
+        if self.request.query_params.get("by") == "team":
+            group = ("situation",)
+        else:
+            group = ("player_id", "player_id__player_name", "situation")
+        return (
+            SituationalSplit.objects.values(*group)
             .annotate(
-                total_po=models.Sum("po"),
-                total_a=models.Sum("a"),
-                total_e=models.Sum("e"),
-                total_pb=models.Sum("pb"),
-                total_sba=models.Sum("sba"),
-                total_cs=models.Sum("cs"),
-                total_dp=models.Sum("dp"),
-                total_tp=models.Sum("tp"),
-                total_games=models.Count("game_id"),
-                total_catchers_interference=models.Sum("catchers_interference"),
+                games=models.Count("game_id", distinct=True),
+                **{total: models.Sum(total) for total in self.totals},
             )
-            .filter(
-                ~models.Q(player_position__exact="P")
-                & (models.Q(total_po__gt=0) | models.Q(total_e__gt=0) | models.Q(total_e__gt=0)),
+            .order_by(*group)
+        )
+
+
+class StatsAsOfLines(APIView):
+    # A player's season-to-date batting, pitching and fielding lines as of
+    # a date, e.g. /api/stats_as_of/?player_id=12&date=2025-04-15; each is
+    # the latest PlayerGame* snapshot on or before it (null if none)
+    permission_classes = [AllowAny]
+    snapshots = {
+        "batting": (PlayerGameBatting, PlayerGameBattingSerializer),
+        "pitching": (PlayerGamePitching, PlayerGamePitchingSerializer),
+        "fielding": (PlayerGameFielding, PlayerGameFieldingSerializer),
+    }
+
+    def get(self, request):
+        return self.list(request)
+
+    def list(self, request):
+        try:
+            date = parse_date(request.query_params.get("date", ""))
+        except ValueError:
+            date = None
+        if date is None or not request.query_params.get("player_id", "").isdigit():
+            return Response(
+                {"error": "player_id and date (YYYY-MM-DD) are required"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
+        player = get_object_or_404(PlayerInfo, pk=request.query_params["player_id"])
+
+        lines = {}
+        for name, (model, serializer_class) in self.snapshots.items():
+            snapshot = model.as_of(player.pk, date)
+            lines[name] = serializer_class(snapshot).data if snapshot else None
+        return Response(
+            {
+                "player_id": player.pk,
+                "player_name": player.player_name,
+                "date": date,
+                "season": date.year,
+                **lines,
+            }
         )
 
 
+class StatsAsOfView(ConditionalGetMixin, IngestCachedMixin, StatsAsOfLines):
+    # the lines only change with an ingest, so they're revalidated and
+    # cached like the viewsets' list()
+    pass
+
+
 class SchoolInfoCreateView(APIView):
     permission_classes = [AllowAny]
 
@@ -370,5 +738,6 @@ class SchoolInfoCreateView(APIView):
         serializer = SchoolInfoSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save()
+            bump_ingest_generation()
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,113 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from django.test import Client
+
+from .models import BatterStat, FieldingStat, GameInfo, PitcherStat
+
+
+# What AllPlayerStats.tsx loads, and what PlayerStats.tsx loads per player
+# (its situational table reads the pre-aggregated situational_splits, not
+# the per-game batter_situational_stats rows)
+TEAM_PATHS = [
+    "total_batting_stats/",
+    "total_pitching_stats/",
+    "total_fielding_stats_by_player/",
+    "total_fielding_stats_by_pos/",
+]
+PLAYER_PATHS = [
+    "batter_stats/?player_id={}",
+    "pitcher_stats/?player_id={}",
+    "fielding_stats/?player_id={}",
+    "situational_splits/?player_id={}",
+]
+
+
+def active_player_ids():
+    """Players with a stat line in the latest season."""
+    latest = GameInfo.objects.order_by("-game_date").values_list("game_date", flat=True).first()
+    if latest is None:
+        return []
+    player_ids = set()
+    for model in (BatterStat, PitcherStat, FieldingStat):
+        player_ids.update(
+            model.objects.filter(game_id__game_date__year=latest.year).values_list(
+                "player_id", flat=True
+            )
+        )
+    return sorted(player_ids)
+
+
+def warm_paths():
+    return TEAM_PATHS + [
+        path.format(player_id)
+        for player_id in active_player_ids()
+        for path in PLAYER_PATHS
+    ]
+
+
+def client_host():
+    """A Host header ALLOWED_HOSTS accepts, for requests made in-process."""
+    host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else "localhost"
+    return host.lstrip(".").replace("*", "localhost")
+
+
+def client_fetcher():
+    """Render in this process through Django's test client. For tests: it
+    fills this process's cache, not the running server's."""
+    local = threading.local()
+
+    def fetch(path):
+        if not hasattr(local, "client"):
+            local.client = Client(HTTP_HOST=client_host())
+        return local.client.get(f"/api/{path}", HTTP_ACCEPT="application/json").status_code
+
+    return fetch
+
+
+def http_fetcher(base_url, timeout=None):
+    """Render through a running server, filling whatever cache it uses.
+
+    A request that fails or takes longer than `timeout` seconds (by default
+    long enough to wait out another worker's render and then render) gives
+    the error's name instead of a status, so one bad path can't stall or
+    crash the caller.
+    """
+    local = threading.local()
+    if timeout is None:
+        timeout = settings.RESPONSE_RENDER_TIMEOUT * 2
+
+    def fetch(path):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        try:
+            return local.session.get(
+                f"{base_url}{path}", headers={"Accept": "application/json"}, timeout=timeout
+            ).status_code
+        except requests.RequestException as error:
+            return type(error).__name__
+
+    return fetch
+
+
+def warm(paths, fetch, workers=4):
+    """Fetch every path with at most `workers` in flight.
+
+    Returns [(path, status, seconds)] and the total wall time; status is
+    whatever `fetch` returned (an HTTP status, or http_fetcher's error name).
+    """
+    def timed(path):
+        start = time.perf_counter()
+        status = fetch(path)
+        return path, status, time.perf_counter() - start
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = list(map(timed, paths))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(timed, paths))
+    return results, time.perf_counter() - start
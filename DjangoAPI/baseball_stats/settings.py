@@ -64,6 +64,10 @@ REST_FRAMEWORK = {
     ),
 }
 
+# Rows per page on the game-log endpoints (batter_stats, pitcher_stats, ...)
+GAME_LOG_PAGE_SIZE = config('GAME_LOG_PAGE_SIZE', default=500, cast=int)
+GAME_LOG_MAX_PAGE_SIZE = config('GAME_LOG_MAX_PAGE_SIZE', default=5000, cast=int)
+
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -111,6 +115,31 @@ DATABASES = {
 }
 
 
+# Cache for rendered aggregate responses (see app/caching.py). The ingest
+# generation that invalidates them and the render locks live in the cache
+# too, so every process that serves or writes stats has to share it:
+# django.core.cache.backends.filebased.FileBasedCache with a directory, or
+# django.core.cache.backends.redis.RedisCache with a redis:// URL. The
+# default local-memory cache is per process; it only suits a single-worker
+# server, and the app refuses to start with it and WEB_CONCURRENCY > 1.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='uva-stats'),
+    }
+}
+
+# Server worker processes (gunicorn reads the same variable)
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', default=1, cast=int)
+
+# How long a rendered response outlives its ingest generation
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=60 * 60 * 24, cast=int)
+
+# How long concurrent requests for an uncached response wait on the one
+# rendering it before rendering it themselves
+RESPONSE_RENDER_TIMEOUT = config('RESPONSE_RENDER_TIMEOUT', default=30, cast=int)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
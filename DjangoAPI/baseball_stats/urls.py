@@ -23,7 +23,8 @@ FieldingStatViewSet, GameInfoViewSet, FieldingStatCreateView, \
 GameInfoCreateView, TeamBattingStatsViewSet, TeamPitchingStatsViewSet, \
 TeamFieldingStatsByPosViewSet, TeamFieldingStatsByPlayerViewSet, \
 BatterSituationalCreateView, BatterSituationalViewSet, \
-SchoolInfoCreateView, SchoolInfoViewSet
+SchoolInfoCreateView, SchoolInfoViewSet, StatsAsOfView, \
+SituationalSplitsViewSet
 
 
 router = DefaultRouter()
@@ -38,6 +39,7 @@ router.register(r'total_fielding_stats_by_pos', TeamFieldingStatsByPosViewSet, b
 router.register(r'total_fielding_stats_by_player', TeamFieldingStatsByPlayerViewSet, basename='team_fielding_stats_by_player')
 router.register(r'game_info', GameInfoViewSet, basename='game_info')
 router.register(r'school_info', SchoolInfoViewSet, basename='school_info')
+router.register(r'situational_splits', SituationalSplitsViewSet, basename='situational_splits')
 
 urlpatterns = [
     # the path for the batter_stats page is still https://localhost:port/batter_stats/
@@ -47,6 +49,7 @@ urlpatterns = [
     path('api/fielding_stats/create/', FieldingStatCreateView.as_view(), name='fielding_stat_create'),
     path('api/game_info/create/', GameInfoCreateView.as_view(), name='game_info_create'),
     path('api/school_info/create/', SchoolInfoCreateView.as_view(), name='school_info_create'),
+    path('api/stats_as_of/', StatsAsOfView.as_view(), name='stats_as_of'),
     path('admin/', admin.site.urls),
     # Include the router's URLs
     path('api/', include(router.urls)),
@@ -17,7 +17,8 @@ def post_stats(endpoint, data):
     "X-API-KEY": API_KEY
     }
     response = requests.post(f'{API_BASE_URL}{endpoint}/', json=data, headers=headers)
-    if response.status_code != 201:
+    # 200 is a re-uploaded line replacing the stored one
+    if response.status_code not in (200, 201):
         print(f'Error posting to {endpoint}: STATUS CODE {response.status_code}')
         print("Response text:", response.text)
         with open('error_log.txt', 'a') as f:
@@ -9,6 +9,7 @@ for the endpoints that already work.
 USAGE:
     python upload_to_django.py game_data/6313117.json
     python upload_to_django.py game_data/*.json
+    python upload_to_django.py --no-warm game_data/*.json
 """
 
 import argparse
@@ -21,8 +22,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'baseball_stats.settings')
 import django
 django.setup()
 
+from app.caching import bump_ingest_generation, cache_is_shared
 from app.models import PlayerInfo, SchoolInfo
-from scrape_and_post import post_stats
+from app.warming import http_fetcher, warm, warm_paths
+from scrape_and_post import API_BASE_URL, post_stats
 
 
 # ============================================================================
@@ -137,6 +140,14 @@ def upload_game(data: dict) -> None:
         post_stats("situational_batting/create", stat_data)
         print(f"  Situational: {sit_batter['player_name']}")
 
+    # The create endpoints already started a new ingest generation; bump it
+    # again for the player/school rows written here through the ORM. Only a
+    # shared cache (file or Redis) carries it to the server; with a
+    # per-process one the server's own bumps, made by the create endpoints
+    # after those rows were written, have to do.
+    if cache_is_shared():
+        bump_ingest_generation()
+
     print(f"  Done uploading game {meta['ncaa_game_id']}")
 
 
@@ -147,6 +158,8 @@ def upload_game(data: dict) -> None:
 def main():
     parser = argparse.ArgumentParser(description="Upload game JSON files to Django database")
     parser.add_argument("json_files", nargs="+", help="Path(s) to game JSON files")
+    parser.add_argument("--no-warm", action="store_true", help="Skip re-rendering the cached endpoints afterwards")
+    parser.add_argument("--warm-workers", type=int, default=4, help="Requests in flight while warming")
     args = parser.parse_args()
 
     for filepath in args.json_files:
@@ -159,6 +172,13 @@ def main():
 
         upload_game(data)
 
+    if not args.no_warm:
+        # Render the pages the new games invalidated through the running
+        # server, so the first visitor hits its cache instead of a cold query
+        results, elapsed = warm(warm_paths(), http_fetcher(API_BASE_URL), workers=args.warm_workers)
+        failed = sum(status != 200 for _, status, _ in results)
+        print(f"\nWarmed {len(results) - failed}/{len(results)} endpoints in {elapsed:.2f}s")
+
     print("\nAll done!")
 
 
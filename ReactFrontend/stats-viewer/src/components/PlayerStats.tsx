@@ -17,7 +17,7 @@ import type {
   BattingStat,
   PitchingStat,
   FieldingStat,
-  BattingSituationalStat,
+  SituationalSplit,
   // SituationalStat,
 } from "../types/statTypes.tsx";
 import {
@@ -51,7 +51,7 @@ export default function PlayerStats() {
       `batter_stats/?player_id=${id}`,
       `pitcher_stats/?player_id=${id}`,
       `fielding_stats/?player_id=${id}`,
-      `batter_situational_stats/?player_id=${id}`,
+      `situational_splits/?player_id=${id}`,
       // `total_batting_stats?player_id=${id}`,
       // `total_pitching_stats?player_id=${id}`,
       // `total_fielding_stats_by_pos?player_id=${id}`,
@@ -67,9 +67,9 @@ export default function PlayerStats() {
     () => playerData.batter_stats || [],
     [playerData.batter_stats]
   );
-  const batterSituationalStats: BattingSituationalStat[] = useMemo(
-      () => playerData.batter_situational_stats || [],
-      [playerData.batter_situational_stats]
+  const situationalSplits: SituationalSplit[] = useMemo(
+      () => playerData.situational_splits || [],
+      [playerData.situational_splits]
   );
   const pitcherStats = useMemo(
     () => playerData.pitcher_stats || [],
@@ -82,74 +82,31 @@ export default function PlayerStats() {
 
 
 
+  // summed per situation by the API, renamed to the tooltip keys the
+  // situational columns read
   const results = useMemo(
-      () => {
-
-        const results: Record<string, number | string>[] = [{}];
-
-        // each different "situation" should be its own ARRAY
-
-        for (const gamePlayed in batterSituationalStats) {
-          console.log("GAME PLAYED: " + gamePlayed);
-          const searchByField: Record<string, any> = batterSituationalStats[gamePlayed];
-          let iter = 0;
-        for (const field in batterSituationalStats[gamePlayed]) {
-
-
-
-          if (typeof searchByField[field] === "object") {
-
-            const temp: Record<string, number | string> = {};
-            temp["Situation"] = field;
-            let first_key = 0;
-            for (const nested_field in searchByField[field]) {
-              if (first_key == 0) {
-                  if (temp["games"] === undefined) {
-                    temp["games"] = 1;
-                  } else
-
-                      // eslint-disable-next-line @typescript-eslint/ban-ts-comment
-                    { // @ts-expect-error
-                      temp["games"] += 1;
-                    }
-
-                first_key++;
-              }
-
-              if (typeof searchByField[field][nested_field] === "string") {
-                // DO NOTHING because we cannot add strings
-              } else {
-                temp[nested_field] = searchByField[field][nested_field];
-              }
-            }
-            // put temp directly in results array if values don't exist already
-            if (results[iter] === undefined) {
-              results[iter] = temp;
-            } else {
-              // add new values to existing fields if values exist
-              for (const key in temp) {
-                if (results[iter][key] === undefined) {
-                  results[iter][key] = temp[key];
-                } else if (typeof results[iter][key] === "string") {
-                  results[iter][key] = temp[key];
-                } else if (typeof results[iter][key] === "number" && typeof temp[key] === "number")
-                {
-                  // eslint-disable-next-line @typescript-eslint/ban-ts-comment
-                  // @ts-expect-error
-                  results[iter][key] += temp[key];
-                }
-              }
-            }
-            iter++;
-
-          }
-        }
-      }
-        return results.filter(
-            (row) => !HIDDEN_SITUATIONS.has(row.Situation as string)
-        );
-      }
-  , [batterSituationalStats]);
+      () => situationalSplits
+          .filter((row) => !HIDDEN_SITUATIONS.has(row.situation))
+          .map((row) => ({
+            Situation: row.situation,
+            games: row.games,
+            succ_opp: `${row.successes}-${row.opportunities}`,
+            AB: row.ab,
+            H: row.h,
+            R: row.r,
+            RBI: row.rbi,
+            BB: row.bb,
+            K: row.k,
+            GO: row.go,
+            FO: row.fo,
+            HBP: row.hbp,
+            SF: row.sf,
+            "2B": row.double,
+            "3B": row.triple,
+            HR: row.hr,
+          })),
+      [situationalSplits]
+  );
 
 
 
@@ -483,7 +440,7 @@ export default function PlayerStats() {
             Extended Pitching Game Log
           </li>
         </div>
-        <div className={batterSituationalStats.length > 0 ? "block" : "hidden"}>
+        <div className={situationalSplits.length > 0 ? "block" : "hidden"}>
           <li
             className={`border-2 px-2 py-1 rounded-full cursor-pointer ${
               toggle === 5
@@ -582,7 +539,7 @@ export default function PlayerStats() {
             )}
           </div>
           <div className={toggle === 5 ? "block" : "hidden"}>
-            {batterSituationalStats.length > 0 && (
+            {situationalSplits.length > 0 && (
                 <DisplayTable table={batterSituationalTable}/>
             )}
           </div>
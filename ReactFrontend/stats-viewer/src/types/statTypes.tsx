@@ -240,3 +240,27 @@ export type SituationalStat = {
   // noinspection SpellCheckingInspection
   succ_opp: string;
 }
+
+// /api/situational_splits/ rows
+export type SituationalSplit = {
+  player_id: number;
+  player_name: string;
+  situation: string;
+  games: number;
+  successes: number;
+  opportunities: number;
+  pct: number | null;
+  ab: number;
+  h: number;
+  r: number;
+  rbi: number;
+  bb: number;
+  k: number;
+  go: number;
+  fo: number;
+  hbp: number;
+  sf: number;
+  double: number;
+  triple: number;
+  hr: number;
+};